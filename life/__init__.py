@@ -17,12 +17,8 @@
 # CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE
 # OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
-__version__ = "0.1.0"
+# NOTE: Do not re-export submodules here. The package root is imported before
+# any subcommand dispatch, so eager imports would drag the whole command
+# surface (rich, pydantic, notion_client, ...) into every CLI startup.
 
-from . import app as app
-from . import cli as cli
-from . import commands as commands
-from . import endpoints as endpoints
-from . import log as log
-from . import notion as notion
-from . import util as util
+__version__ = "0.1.0"
@@ -17,7 +17,7 @@
 # CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE
 # OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
-import life
+from life.cli import main
 
 if __name__ == "__main__":
-    life.cli.main()
+    main()
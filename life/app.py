@@ -19,65 +19,112 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import os
+import pickle
+import stat
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
-from typing import IO, NoReturn
-
-import tomllib
-from pydantic import UUID4, BaseModel, TypeAdapter
-from rich import print
-from rich.console import Console
-from rich.status import Status
-
-from life.endpoints import (
-    AccountsEndpoint,
-    AreasEndpoint,
-    DailyEndpoint,
-    NotesEndpoint,
-    ResourcesEndpoint,
-    SessionsEndpoint,
-    TasksEndpoint,
-    TransactionsEndpoint,
-)
-from life.notion import Client
-from life.notion.endpoints import BlockEndpoint, DatabaseEndpoint
+from typing import IO, TYPE_CHECKING, Any, NoReturn
+
+from pydantic import BaseModel, ConfigDict
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.status import Status
+    from rich.text import Text
+
+    from life.endpoints import (
+        AccountsEndpoint,
+        AreasEndpoint,
+        DailyEndpoint,
+        NotesEndpoint,
+        ResourcesEndpoint,
+        SessionsEndpoint,
+        TasksEndpoint,
+        TransactionsEndpoint,
+    )
+    from life.notion import Client
+    from life.notion.endpoints import BlockEndpoint, DatabaseEndpoint
+
+
+def _load_toml(f: IO[bytes]) -> dict:
+    try:
+        # `rtoml` is noticeably faster than stdlib `tomllib` and worth it on a
+        # parse-on-every-startup path, but it remains strictly optional.
+        import rtoml
+    except ImportError:
+        import tomllib
+
+        return tomllib.load(f)
+    return rtoml.loads(f.read().decode())
+
 
 # ==============================================================================
 # CONSTANTS
 # ==============================================================================
 
 DEFAULT_CONFIG_PATH = "~/.config/life/life.toml"
+DEFAULT_CACHE_PATH = "~/.cache/life/config.pkl"
+
+ERROR_PREFIX = " [red]✘[/] "
+SUCCESS_PREFIX = " [green]:heavy_check_mark:[/] "
+
+
+@cache
+def _compile_markup(markup: str) -> Text:
+    """Parse a Rich markup fragment once and reuse the resulting Text."""
+    from rich.text import Text
+
+    return Text.from_markup(markup)
 
 # ==============================================================================
 # CONFIG
 # ==============================================================================
 
 
-class ApiConfig(BaseModel):
+class BaseConfigModel(BaseModel):
+    # Config models are validated at most once per invocation (and not at
+    # all when the pickle cache is warm), so defer the validator build.
+    # They are never mutated afterwards, so freeze them and ignore unknown
+    # keys instead of carrying them around.
+    model_config = ConfigDict(
+        defer_build=True,
+        frozen=True,
+        extra="ignore",
+        revalidate_instances="never",
+    )
+
+
+class ApiConfig(BaseConfigModel):
     secret: str
 
 
-class DatabaseConfig(BaseModel):
-    daily: UUID4
-    areas: UUID4
-    tasks: UUID4
-    sessions: UUID4
-    notes: UUID4
-    accounts: UUID4
-    transactions: UUID4
-    plantarium: UUID4
-    garden: UUID4
-    resources: UUID4
+class DatabaseConfig(BaseConfigModel):
+    # Database ids are forwarded verbatim to the Notion client, so they are
+    # kept as opaque strings instead of round-tripping through uuid.UUID.
+    daily: str
+    areas: str
+    tasks: str
+    sessions: str
+    notes: str
+    accounts: str
+    transactions: str
+    plantarium: str
+    garden: str
+    resources: str
 
 
-class BlockConfig(BaseModel):
-    today: UUID4
-    tomorrow: UUID4
-    later: UUID4
+class BlockConfig(BaseConfigModel):
+    today: str
+    tomorrow: str
+    later: str
 
 
-class IconConfig(BaseModel):
+class IconConfig(BaseConfigModel):
     daily: str | None = None
     areas: str | None = None
     tasks: str | None = None
@@ -90,7 +137,7 @@ class IconConfig(BaseModel):
     resources: str | None = None
 
 
-class Config(BaseModel):
+class Config(BaseConfigModel):
     api: ApiConfig
     databases: DatabaseConfig
     blocks: BlockConfig
@@ -98,7 +145,49 @@ class Config(BaseModel):
 
     @staticmethod
     def parse_toml(f: IO[bytes]) -> Config:
-        return TypeAdapter(Config).validate_python(tomllib.load(f))
+        return Config.model_validate(_load_toml(f))
+
+    @staticmethod
+    def load(
+        path: Path,
+        cache_path: str = DEFAULT_CACHE_PATH,
+        st: os.stat_result | None = None,
+    ) -> Config:
+        """Load config from PATH, reusing a pickled snapshot when up-to-date."""
+        if st is None:
+            st = path.stat()
+        stamp = f"{st.st_mtime_ns} {st.st_size}"
+
+        cache = Path(cache_path).expanduser()
+        sidecar = cache.with_suffix(".stamp")
+
+        # AttributeError covers snapshots whose classes moved in an
+        # upgrade, same as cache.load; a stale pickle must never wedge
+        # startup.
+        try:
+            if sidecar.read_text() == stamp:
+                with cache.open(mode="rb") as f:
+                    return pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError, AttributeError):
+            pass
+
+        with path.open(mode="rb") as f:
+            config = Config.parse_toml(f)
+
+        try:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache.with_suffix(".tmp")
+            # The snapshot embeds the API secret; keep it owner-only like
+            # the config file it mirrors.
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(config, f)
+            os.replace(tmp, cache)
+            sidecar.write_text(stamp)
+        except OSError:
+            pass
+
+        return config
 
 
 # ==============================================================================
@@ -106,7 +195,7 @@ class Config(BaseModel):
 # ==============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseEndpoints:
     daily: DailyEndpoint
     areas: AreasEndpoint
@@ -120,45 +209,58 @@ class DatabaseEndpoints:
     resources: ResourcesEndpoint
 
     def __init__(self, client: Client, config: DatabaseConfig, icons: IconConfig):
-        self.daily = DailyEndpoint(
-            client=client, id=str(config.daily), default_icon=icons.daily
-        )
-        self.areas = AreasEndpoint(
-            client=client, id=str(config.areas), default_icon=icons.areas
-        )
-        self.tasks = TasksEndpoint(
-            client=client, id=str(config.tasks), default_icon=icons.tasks
-        )
-        self.sessions = SessionsEndpoint(
-            client=client, id=str(config.sessions), default_icon=icons.sessions
-        )
-        self.notes = NotesEndpoint(
-            client=client, id=str(config.notes), default_icon=icons.notes
-        )
-        self.accounts = AccountsEndpoint(
-            client=client, id=str(config.accounts), default_icon=icons.accounts
-        )
-        self.transactions = TransactionsEndpoint(
-            client=client, id=str(config.transactions), default_icon=icons.transactions
+        from life.endpoints import (
+            AccountsEndpoint,
+            AreasEndpoint,
+            DailyEndpoint,
+            NotesEndpoint,
+            SessionsEndpoint,
+            TasksEndpoint,
+            TransactionsEndpoint,
         )
+
+        table = [
+            ("daily", DailyEndpoint),
+            ("areas", AreasEndpoint),
+            ("tasks", TasksEndpoint),
+            ("sessions", SessionsEndpoint),
+            ("notes", NotesEndpoint),
+            ("accounts", AccountsEndpoint),
+            ("transactions", TransactionsEndpoint),
+        ]
+
+        for name, endpoint in table:
+            setattr(
+                self,
+                name,
+                endpoint(
+                    client=client,
+                    id=getattr(config, name),
+                    default_icon=getattr(icons, name),
+                ),
+            )
+
         self.plantarium = None
         self.garden = None
         self.resources = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockEndpoints:
     today: BlockEndpoint
     tomorrow: BlockEndpoint
     later: BlockEndpoint
 
     def __init__(self, client: Client, config: BlockConfig):
-        self.today = BlockEndpoint(client=client, id=str(config.today))
-        self.tomorrow = BlockEndpoint(client=client, id=str(config.tomorrow))
-        self.later = BlockEndpoint(client=client, id=str(config.later))
+        from life.notion.endpoints import BlockEndpoint
 
+        for name in ("today", "tomorrow", "later"):
+            setattr(
+                self, name, BlockEndpoint(client=client, id=getattr(config, name))
+            )
 
-@dataclass
+
+@dataclass(slots=True)
 class App:
     config: Config
     client: Client
@@ -173,16 +275,48 @@ class App:
     ) -> None:
         self.verbosity = verbosity
 
-        path = Path(config_path).expanduser()
+        # A single os.stat answers both "does it exist" and "is it a regular
+        # file", and its result seeds the config-cache stamp check.
+        raw_path = os.path.expanduser(config_path)
+
+        # Any stat failure (missing file, non-directory in the path,
+        # unreadable parent) means there is no usable config there.
+        try:
+            st = os.stat(raw_path)
+        except OSError:
+            raise ValueError(
+                f"Could not find config file under '{config_path}'"
+            ) from None
 
-        if not path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise ValueError(f"Could not find config file under '{config_path}'")
 
-        with path.open(mode="rb") as f:
-            config = Config.parse_toml(f)
+        import httpx
+        from rich.console import Console
+
+        from life.notion import Client
+
+        # Keep-alive pooling (and HTTP/2 multiplexing when `h2` is installed)
+        # lets the many independent fetches of a command share one connection
+        # instead of paying a TCP+TLS handshake per call. The flag must go on
+        # the transport: Client(http2=...) only shapes the default transport,
+        # which a custom one replaces wholesale.
+        try:
+            import h2  # noqa: F401
+
+            http2 = True
+        except ImportError:
+            http2 = False
 
-        self.config = config
-        self.client = Client(auth=self.config.api.secret)
+        limits = httpx.Limits(max_keepalive_connections=8, keepalive_expiry=30)
+        transport = httpx.HTTPTransport(limits=limits, retries=3, http2=http2)
+        http = httpx.Client(transport=transport)
+
+        # Close the pooled connections cleanly instead of relying on GC.
+        atexit.register(http.close)
+
+        self.config = Config.load(Path(raw_path), st=st)
+        self.client = Client(auth=self.config.api.secret, client=http)
         self.console = Console()
         self.db = DatabaseEndpoints(
             self.client, self.config.databases, self.config.default_icons
@@ -192,15 +326,23 @@ class App:
 
         self.log.info("Application initialized!")
 
+    def gather(self, *callables: Callable[[], Any]) -> list[Any]:
+        """Run independent blocking calls concurrently, results in order."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=len(callables)) as executor:
+            futures = [executor.submit(callable) for callable in callables]
+            return [future.result() for future in futures]
+
     def exit(self, code: int = 0) -> NoReturn:
         raise SystemExit(code)
 
     def error(self, message: str) -> App:
-        print(f" [red]✘[/] {message}")
+        self.console.print(_compile_markup(ERROR_PREFIX), message, sep="")
         return self
 
     def success(self, message: str = "DONE!") -> App:
-        print(f" [green]:heavy_check_mark:[/] {message}")
+        self.console.print(_compile_markup(SUCCESS_PREFIX), message, sep="")
         return self
 
     def working(self, message: str = "Working", **kwargs) -> Status:
@@ -0,0 +1,81 @@
+# Copyright 2024 Gustavo Leite
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies
+# or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF
+# CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE
+# OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""Small disk cache for quasi-static Notion query results.
+
+Cached values are pickled under ``~/.cache/life/queries/`` and expire by
+file age, so a stale entry simply falls through to a regular fetch. A
+corrupt or unreadable entry is treated as a miss, never as an error.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Any
+
+# ==============================================================================
+# CONSTANTS
+# ==============================================================================
+
+CACHE_DIR = "~/.cache/life/queries"
+
+# ==============================================================================
+# FUNCTIONS
+# ==============================================================================
+
+
+def load(name: str, max_age: float) -> Any | None:
+    """Return the cached value NAME if younger than MAX_AGE seconds."""
+    path = Path(CACHE_DIR).expanduser() / name
+
+    try:
+        if time.time() - path.stat().st_mtime > max_age:
+            return None
+        with path.open(mode="rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError, AttributeError):
+        return None
+
+
+def store(name: str, value: Any) -> None:
+    """Cache VALUE under NAME, best effort."""
+    path = Path(CACHE_DIR).expanduser() / name
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with tmp.open(mode="wb") as f:
+            pickle.dump(value, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def clear() -> None:
+    """Drop every cached query result."""
+    directory = Path(CACHE_DIR).expanduser()
+
+    try:
+        for entry in directory.iterdir():
+            entry.unlink(missing_ok=True)
+    except OSError:
+        pass
@@ -17,27 +17,67 @@
 # CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE
 # OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
+from __future__ import annotations
+
+import importlib
+import sys
 from typing import Annotated
 
+from click import Command
+from click import Context as ClickContext
 from typer import Context, Option, Typer
-
-from life.app import App
-from life.commands import account, area, habit, note, session, task, todo, transaction
+from typer.core import TyperGroup
+from typer.main import get_group
 
 # ==============================================================================
 # GLOBALS
 # ==============================================================================
 
-cli = Typer()
+SUBCOMMANDS = {
+    "habit": ("life.commands.habit", "Manage habits."),
+    "session": ("life.commands.session", "Manage sessions."),
+    "task": ("life.commands.task", "Manage tasks."),
+    "note": ("life.commands.note", "Manage notes."),
+    "area": ("life.commands.area", "Manage areas."),
+    "account": ("life.commands.account", "Manage accounts."),
+    "transaction": ("life.commands.transaction", "Manage transactions."),
+    "todo": ("life.commands.todo", "Manage to-do items."),
+}
+
+
+class LazyGroup(TyperGroup):
+    """Group that imports each subcommand module only when it is invoked."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._loaded: dict[str, Command] = {}
+
+    def list_commands(self, ctx: ClickContext) -> list[str]:
+        return list(SUBCOMMANDS)
+
+    def get_command(self, ctx: ClickContext, name: str) -> Command | None:
+        if name not in SUBCOMMANDS:
+            return super().get_command(ctx, name)
 
-cli.add_typer(habit.cli, name="habit", help="Manage habits.")
-cli.add_typer(session.cli, name="session", help="Manage sessions.")
-cli.add_typer(task.cli, name="task", help="Manage tasks.")
-cli.add_typer(note.cli, name="note", help="Manage notes.")
-cli.add_typer(area.cli, name="area", help="Manage areas.")
-cli.add_typer(account.cli, name="account", help="Manage accounts.")
-cli.add_typer(transaction.cli, name="transaction", help="Manage transactions.")
-cli.add_typer(todo.cli, name="todo", help="Manage to-do items.")
+        # Resolution happens more than once per invocation (dispatch plus
+        # help rendering), so build each click group at most once.
+        group = self._loaded.get(name)
+        if group is None:
+            module_name, help = SUBCOMMANDS[name]
+            module = importlib.import_module(module_name)
+            group = get_group(module.cli)
+            group.name = name
+            group.help = help
+            self._loaded[name] = group
+        return group
+
+
+# Rich pretty exceptions only pay off on a terminal; scripted runs
+# (shell hooks, cron) keep the plain traceback path and skip the
+# exception-hook setup entirely.
+_INTERACTIVE = sys.stdout.isatty()
+
+cli = Typer(cls=LazyGroup, pretty_exceptions_enable=_INTERACTIVE)
 
 # ==============================================================================
 # MAIN CALLBACK
@@ -48,10 +88,20 @@ cli.add_typer(todo.cli, name="todo", help="Manage to-do items.")
 def main_callback(
     ctx: Context,
     verbose: Annotated[int, Option("--verbose", "-v", count=True)] = 0,
+    no_cache: Annotated[
+        bool, Option("--no-cache", help="Discard cached query results.")
+    ] = False,
 ):
     """
     Life, Notion dashboard integration from the command-line!
     """
+    from life.app import App
+
+    if no_cache:
+        from life import cache
+
+        cache.clear()
+
     ctx.obj = App(verbosity=verbose)
 
 
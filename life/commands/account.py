@@ -19,13 +19,10 @@
 
 from typing import Annotated
 
-from rich import box
-from rich.table import Table
 from typer import Context, Option, Typer, launch
 
 from life.app import App
 from life.notion.filters import Checkbox, Select
-from life.util import dictfzf
 
 # ==============================================================================
 # GLOBAL
@@ -33,6 +30,11 @@ from life.util import dictfzf
 
 cli = Typer()
 
+# Shared, input-independent filters hoisted so each invocation reuses the
+# same already-built object tree.
+_FILTER_VISIBLE = Checkbox("Hidden").unchecked()
+_FILTER_CREDIT = _FILTER_VISIBLE & Select("Type").equals("Credit")
+
 # ==============================================================================
 # ACCOUNTS
 # ==============================================================================
@@ -43,11 +45,11 @@ def account_open(ctx: Context, all: Annotated[bool, Option("--all", "-a")] = Fal
     """
     Open an account on the browser.
     """
+    from life.util import dictfzf
+
     app: App = ctx.obj
 
-    filter = Checkbox("Hidden").unchecked()
-    if not all:
-        filter &= Select("Type").equals("Credit")
+    filter = _FILTER_VISIBLE if all else _FILTER_CREDIT
 
     with app.working("Fetching accounts"):
         accounts = app.db.accounts.query(filter).by_name()
@@ -64,29 +66,29 @@ def account_view(ctx: Context, all: Annotated[bool, Option("--all", "-a")] = Fal
     """
     View a summary of accounts on the terminal.
     """
+    from rich import box
+    from rich.table import Table
+
     app: App = ctx.obj
 
-    filter = Checkbox("Hidden").unchecked()
-    if not all:
-        filter &= Select("Type").equals("Credit")
+    filter = _FILTER_VISIBLE if all else _FILTER_CREDIT
 
     with app.working("Fetching accounts"):
         accounts = app.db.accounts.query(filter).by_name()
 
     table = Table("Account", "Balance", box=box.HORIZONTALS)
 
-    for name, account in accounts.items():
-        balance = account.formula("Balance").as_number()
-        if balance is None:
-            balance = 0.0
-        if balance > 0:
-            balance_str = f"[green]{balance:10.2f}[/]"
-        elif balance < 0:
-            balance_str = f"[red]{balance:10.2f}[/]"
-        else:
-            balance_str = f"{balance:10.2f}"
-        name_str = f"[i]{name}[/]"
-        table.add_row(name_str, balance_str)
+    pairs = [
+        (name, account.formula("Balance").as_number() or 0.0)
+        for name, account in accounts.items()
+    ]
+
+    # Indexed by sign(balance) + 1, avoiding a three-way branch per row.
+    formats = ("[red]{:10.2f}[/]", "{:10.2f}", "[green]{:10.2f}[/]")
+
+    for name, balance in pairs:
+        sign = (balance > 0) - (balance < 0)
+        table.add_row(f"[i]{name}[/]", formats[sign + 1].format(balance))
 
     with app.console.pager(styles=True):
         app.console.print(table)
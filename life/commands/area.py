@@ -20,7 +20,6 @@
 from typer import Context, Typer, launch
 
 from life.app import App
-from life.util import dictfzf
 
 # ==============================================================================
 # GLOBAL
@@ -40,6 +39,8 @@ def area_open(
     """
     Open an area on the browser.
     """
+    from life.util import dictfzf
+
     app: App = ctx.obj
 
     with app.working("Fetching areas"):
@@ -17,15 +17,11 @@
 # CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE
 # OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
-from typing import Annotated, Optional
+from typing import Annotated
 
-from rich import box
-from rich.table import Table
 from typer import Argument, Context, Option, Typer
 
 from life.app import App
-from life.notion.filters import Checkbox
-from life.util import multifzf
 
 # ==============================================================================
 # GLOBAL
@@ -46,6 +42,9 @@ def habit_show(
     """
     Show habits for an offset of DAYS from today.
     """
+    from rich import box
+    from rich.table import Table
+
     app: App = ctx.obj
 
     with app.working("Fetching daily"):
@@ -61,12 +60,9 @@ def habit_show(
         table.add_column(when.strftime("%Y/%m/%d"))
         table.add_column("")
 
-        habits = sorted(daily.checkboxes().keys())
-
-        for habit in habits:
-            check = daily.checkbox(habit).value()
-            check = "[green]✔" if check else "[red]✘"
-            table.add_row(habit, f"{check}")
+        for habit, prop in sorted(daily.checkboxes().items()):
+            check = "[green]✔" if prop.value() else "[red]✘"
+            table.add_row(habit, check)
 
     app.console.print(table)
 
@@ -74,12 +70,14 @@ def habit_show(
 @cli.command("mark")
 def habit_mark(
     ctx: Context,
-    name: Annotated[Optional[list[str]], Argument()] = None,
+    name: Annotated[list[str] | None, Argument()] = None,
     check: Annotated[bool, Option("--check/--uncheck", "-c/-C")] = True,
 ):
     """
     Mark a habit NAME as completed for today.
     """
+    from life.util import multifzf
+
     app: App = ctx.obj
 
     with app.working("Fetching daily"):
@@ -96,7 +94,7 @@ def habit_mark(
     with app.working("Updating habits"):
         app.db.daily.update(
             page_id=today.id,
-            properties=[Checkbox(habit).assign(checked=check) for habit in selected],
+            properties={habit: {"checkbox": check} for habit in selected},
         )
 
     app.success()
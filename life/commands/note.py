@@ -17,7 +17,8 @@
 # CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE
 # OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
-from typing import Annotated, Optional
+import re
+from typing import Annotated
 
 from click import edit
 from typer import Context, Option, Typer, launch
@@ -25,7 +26,7 @@ from typer import Context, Option, Typer, launch
 from life.app import App
 from life.notion.filters import Relation, Select, Title
 from life.notion.schema import BlockBuilder as bb
-from life.util import dictfzf, iterfzf
+from life.util import dictfzf, iterfzf, prefetch
 
 # ==============================================================================
 # GLOBAL
@@ -33,6 +34,8 @@ from life.util import dictfzf, iterfzf
 
 cli = Typer()
 
+_PARAGRAPH_RE = re.compile(r"\n{2,}")
+
 # ==============================================================================
 # NOTES
 # ==============================================================================
@@ -41,7 +44,7 @@ cli = Typer()
 @cli.command("open")
 def note_open(
     ctx: Context,
-    kind: Annotated[Optional[str], Option("--type", "-t")] = None,
+    kind: Annotated[str | None, Option("--type", "-t")] = None,
 ):
     """
     Open a note on the browser.
@@ -73,13 +76,31 @@ def note_new(
     Create a new note.
     """
     app: App = ctx.obj
+
+    # Kick off the area/type fetches before opening the editor; the user's
+    # editing time comfortably hides both round-trips. Daemon threads, so
+    # bailing out on an empty note never waits on the results.
+    if not quick:
+        fetch_areas = prefetch(app.db.areas.all)
+        fetch_kinds = prefetch(
+            lambda: app.db.notes.schema().select("Type").options()
+        )
+
     contents = edit("Untitled Note")
 
     if contents is None or contents == "":
         app.error("Empty note.").exit(1)
 
-    contents = contents.strip().split("\n\n")
-    contents = [paragraph.strip().replace("\n", " ") for paragraph in contents]
+    # Splitting on runs of blank lines and re-joining on whitespace collapses
+    # internal newlines and tabs in a single pass per paragraph.
+    contents = [
+        " ".join(paragraph.split())
+        for paragraph in _PARAGRAPH_RE.split(contents.strip())
+        if paragraph.strip()
+    ]
+
+    if len(contents) == 0:
+        app.error("Empty note.").exit(1)
 
     title = contents[0]
     body = contents[1:]
@@ -96,14 +117,16 @@ def note_new(
         )
         app.success().exit(0)
 
+    with app.working("Fetching areas & types"):
+        areas = fetch_areas.result()
+        kinds = fetch_kinds.result()
+
     # Select the Area
-    areas = app.db.areas.all()
     area = dictfzf(areas, prompt="> Select the area: ")
     if area is None:
         app.error("No area selected.").exit(1)
 
     # Select the type
-    kinds = app.db.notes.schema().select("Type").options()
     kind = iterfzf([k.name for k in kinds], prompt="> Select the type: ")
     if kind is None:
         app.error("No type selected.").exit(1)
@@ -20,13 +20,10 @@
 from datetime import datetime, timezone
 from typing import Annotated
 
-from rich.prompt import Confirm, Prompt
-from rich.tree import Tree
 from typer import Argument, Context, Typer, launch
 
 from life.app import App
 from life.notion.filters import Relation, Status, Title
-from life.util import dictfzf
 
 # ==============================================================================
 # GLOBAL
@@ -48,12 +45,26 @@ def session_start(
     """
     Start a new session.
     """
+    # Rich widgets and the fzf wrapper are only needed once this command
+    # actually runs; import them here to keep other invocations lean.
+    from rich.prompt import Confirm, Prompt
+
+    from life.util import dictfzf
+
     app: App = ctx.obj
 
-    with app.working("Fetching sessions"):
-        sessions = app.db.sessions.in_progress()
+    # The three fetches hit independent databases; overlap them so the
+    # wall time is the slowest round-trip instead of the sum.
+    # Only the daily page id is needed here, and that is cached on disk
+    # per day, so the dailies leg usually resolves without a round-trip.
+    with app.working("Fetching sessions, dailies & tasks"):
+        in_progress, today_id, tasks = app.gather(
+            app.db.sessions.any_in_progress,
+            app.db.daily.today_id,
+            app.db.tasks.not_done,
+        )
 
-    if len(sessions) > 0:
+    if in_progress:
         if not Confirm.ask("There is a session in-progress, continue?"):
             raise SystemExit(0)
 
@@ -62,18 +73,12 @@ def session_start(
     else:
         title = " ".join(name)
 
-    with app.working("Fetching dailies"):
-        today = app.db.daily.today()
-
-    with app.working("Fetching tasks"):
-        tasks = app.db.tasks.not_done()
-
     task = dictfzf(tasks, prompt="> Select the task: ")
 
     properties = [
         Title().assign(title),
         Status().assign("In progress"),
-        Relation("Daily").assign(today.id),
+        Relation("Daily").assign(today_id),
     ]
 
     if task is not None:
@@ -84,15 +89,18 @@ def session_start(
     if confirm and not Confirm.ask("Create session?", default=False):
         app.error("Aborted.").exit(0)
 
+    # The session create and the task status update are independent
+    # writes, so issue them together instead of back to back.
     with app.working("Creating session"):
-        session = app.db.sessions.create(
-            properties=properties,
-        )
-
-    if task is not None and task.status().not_started():
-        app.db.tasks.update(
-            page_id=task.id, properties=[Status().assign("In progress")]
-        )
+        if task is not None and task.status().not_started():
+            session, _ = app.gather(
+                lambda: app.db.sessions.create(properties=properties),
+                lambda: app.db.tasks.update(
+                    page_id=task.id, properties=[Status().assign("In progress")]
+                ),
+            )
+        else:
+            session = app.db.sessions.create(properties=properties)
 
     if task is not None:
         launch(task.get_url())
@@ -107,21 +115,29 @@ def session_end(ctx: Context):
     """
     End the current session.
     """
+    from rich.tree import Tree
+
+    from life.util import dictfzf
+
     app: App = ctx.obj
 
+    # A two-row page is enough to tell none/one/many apart without
+    # transferring every in-progress session up front.
     with app.working("Fetching sessions"):
-        sessions = app.db.sessions.in_progress()
+        sessions = app.db.sessions.in_progress(page_size=2)
 
     if len(sessions) == 0:
         app.success("No sessions in-progress.").exit(0)
 
-    session = None
     if len(sessions) > 1:
-        session = dictfzf(sessions, prompt="> Select the session: ")
-        if session is None:
-            app.error("No session selected.").exit(1)
-    else:
-        session = next(iter(sessions.values()))
+        with app.working("Fetching sessions"):
+            sessions = app.db.sessions.in_progress()
+
+    # dictfzf returns a lone candidate directly, so the single-session
+    # case needs no special branch here.
+    session = dictfzf(sessions, prompt="> Select the session: ")
+    if session is None:
+        app.error("No session selected.").exit(1)
 
     with app.working("Updating session"):
         session = app.db.sessions.update(
@@ -144,6 +160,8 @@ def session_info(ctx: Context):
     """
     Get info about the current session.
     """
+    from rich.tree import Tree
+
     app: App = ctx.obj
 
     with app.working("Fetching sessions"):
@@ -159,7 +177,9 @@ def session_info(ctx: Context):
 
         if session.status().name() == "In progress":
             icon = "[blue]:play_button:[/]"
-            duration = (now - start).seconds / 60.0
+            # total_seconds() includes the days component; `.seconds`
+            # would wrap a session that crossed midnight modulo 24h.
+            duration = (now - start).total_seconds() / 60.0
         else:
             icon = "[green]:heavy_check_mark:[/]"
             duration = session.formula("Duration").as_number()
@@ -22,7 +22,6 @@ from typing import Annotated
 from typer import Context, Option, Typer, launch
 
 from life.app import App
-from life.util import dictfzf
 
 # ==============================================================================
 # GLOBAL
@@ -43,6 +42,8 @@ def task_open(
     """
     Open a task on the browser.
     """
+    from life.util import dictfzf
+
     app: App = ctx.obj
 
     tasks = None
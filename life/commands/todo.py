@@ -34,30 +34,29 @@ cli = Typer()
 # ==============================================================================
 
 
-@cli.command("today")
-def todo_today(ctx: Context, what: list[str]):
-    """
-    Create a new to-do item in today's column in Work dashboard.
-    """
+def _todo(ctx: Context, bucket: str, what: list[str]) -> None:
     app: App = ctx.obj
 
     with app.working("Adding to-do item"):
-        app.block.today.after(children=[bb.todo(" ".join(what))])
+        getattr(app.block, bucket).after(children=[bb.todo(" ".join(what))])
 
     app.success()
 
 
+@cli.command("today")
+def todo_today(ctx: Context, what: list[str]):
+    """
+    Create a new to-do item in today's column in Work dashboard.
+    """
+    _todo(ctx, "today", what)
+
+
 @cli.command("tomorrow")
 def todo_tomorrow(ctx: Context, what: list[str]):
     """
     Create a new to-do item in tomorrow's column Work dashboard.
     """
-    app: App = ctx.obj
-
-    with app.working("Adding to-do item"):
-        app.block.tomorrow.after(children=[bb.todo(" ".join(what))])
-
-    app.success()
+    _todo(ctx, "tomorrow", what)
 
 
 @cli.command("later")
@@ -65,9 +64,4 @@ def todo_later(ctx: Context, what: list[str]):
     """
     Create a new to-do item in later column in Work dashboard.
     """
-    app: App = ctx.obj
-
-    with app.working("Adding to-do item"):
-        app.block.later.after(children=[bb.todo(" ".join(what))])
-
-    app.success()
+    _todo(ctx, "later", what)
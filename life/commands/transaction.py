@@ -20,17 +20,14 @@
 import functools
 from datetime import date, datetime
 from enum import Enum
-from typing import Annotated, Optional
+from operator import methodcaller
+from typing import Annotated
 
-from rich import box
-from rich.prompt import Confirm, FloatPrompt, Prompt
-from rich.table import Table
 from typer import Context, Option, Typer
 
 from life.app import App
 from life.notion.filters import Date, Number, Relation, Title, UniqueID
 from life.notion.schema import Page
-from life.util import dictfzf
 
 # ==============================================================================
 # GLOBAL
@@ -87,6 +84,10 @@ def transaction_view(ctx: Context, period: Period = Period.month):
     """
     View a summary of transactions on the terminal.
     """
+    from rich import box
+    from rich.live import Live
+    from rich.table import Table
+
     app: App = ctx.obj
 
     filter = None
@@ -102,69 +103,89 @@ def transaction_view(ctx: Context, period: Period = Period.month):
 
     sort = [Date().sort("ascending"), UniqueID().sort("ascending")]
 
-    with app.working("Fetching transactions"):
-        transactions = app.db.transactions.query(filter, sort).by_id()
-
-    if len(transactions) == 0:
-        app.error("No transactions in the selected period.").exit(0)
-
     with app.working("Fetching accounts"):
-        accounts = app.db.accounts.query().by_id()
-
-    table = Table("Day", "Name", "Value", "Source", "Destination", box=box.HORIZONTALS)
-
-    for _, trn in transactions.items():
-        # Retrieve properties
-        name = trn.name()
-        when = trn.date().start()
-        cash = trn.number("Value").value()
-        src = trn.relation("Source").value()
-        dst = trn.relation("Destination").value()
-
-        assert len(src) == 1
-        assert len(dst) == 1
-
-        src = accounts[src.pop().id]
-        dst = accounts[dst.pop().id]
+        accounts = app.db.accounts.all().by_id()
 
-        # Format properties
-        src_color = _acc_color(src)
-        dst_color = _acc_color(dst)
-        src_name = _acc_name(src)
-        dst_name = _acc_name(dst)
+    # Resolve every account to its formatted cell once, so the row loop
+    # below is plain dict lookups instead of repeated property chains.
+    acc_table = {
+        id: f"[{_acc_color(page)}]{_acc_name(page)}[/]"
+        for id, page in accounts.items()
+    }
 
-        title = f"[i]{name}[/i]"
-        if when is not None:
-            when = f"[dim]{when.strftime('%b %d')}[/dim]"
-        else:
-            when = ""
-        cash = f"R$ {cash:10.2f}"
-        src_name = f"[{src_color}]{src_name}[/]"
-        dst_name = f"[{dst_color}]{dst_name}[/]"
-
-        table.add_row(when, title, cash, src_name, dst_name)
+    table = Table("Day", "Name", "Value", "Source", "Destination", box=box.HORIZONTALS)
 
-    with app.console.pager(styles=True):
-        app.console.print(table)
+    # Bind the property lookups once so the row loop calls them with the
+    # argument already attached instead of re-resolving names per row.
+    get_value = methodcaller("number", "Value")
+    get_src = methodcaller("relation", "Source")
+    get_dst = methodcaller("relation", "Destination")
+
+    # Rows are sorted by date, so consecutive transactions share a day;
+    # amortize strftime to one call per distinct date.
+    day_cells: dict[int, str] = {}
+
+    # Stream rows into the table as result pages arrive, so long periods
+    # show output after one round-trip instead of after the full walk.
+    with Live(table, console=app.console, refresh_per_second=8):
+        for trn in app.db.transactions.iter_query(filter, sort):
+            # Retrieve properties
+            name = trn.name()
+            when = trn.date().start()
+            cash = get_value(trn).value()
+            src = get_src(trn).value()
+            dst = get_dst(trn).value()
+
+            assert len(src) == 1
+            assert len(dst) == 1
+
+            # `next(iter(...))` reads the single related id without mutating
+            # the underlying relation like `.pop()` did.
+            src_name = acc_table[next(iter(src)).id]
+            dst_name = acc_table[next(iter(dst)).id]
+
+            title = f"[i]{name}[/i]"
+            if when is not None:
+                key = when.toordinal()
+                day = day_cells.get(key)
+                if day is None:
+                    day = day_cells.setdefault(
+                        key, f"[dim]{when.strftime('%b %d')}[/dim]"
+                    )
+                when = day
+            else:
+                when = ""
+            cash = f"R$ {cash:10.2f}"
+
+            table.add_row(when, title, cash, src_name, dst_name)
+
+    if table.row_count == 0:
+        app.error("No transactions in the selected period.").exit(0)
 
 
 @cli.command("add")
 def transaction_add(
     ctx: Context,
-    name: Annotated[Optional[str], Option("--name", "-n")] = None,
-    value: Annotated[Optional[float], Option("--value", "-v")] = None,
-    when: Annotated[Optional[datetime], Option("--date", "-d")] = None,
-    source: Annotated[Optional[str], Option("--src", "-s")] = None,
-    destination: Annotated[Optional[str], Option("--dst", "-t")] = None,
+    name: Annotated[str | None, Option("--name", "-n")] = None,
+    value: Annotated[float | None, Option("--value", "-v")] = None,
+    when: Annotated[datetime | None, Option("--date", "-d")] = None,
+    source: Annotated[str | None, Option("--src", "-s")] = None,
+    destination: Annotated[str | None, Option("--dst", "-t")] = None,
     confirm: Annotated[bool, Option("--confirm/--no-confirm")] = True,
 ):
     """
     Add a new transaction.
     """
+    from rich.prompt import Confirm, FloatPrompt, Prompt
+
+    from life.util import dictfzf, prefetch
+
     app: App = ctx.obj
 
-    with app.working("Fetching accounts"):
-        accounts = app.db.accounts.query().by_name()
+    # Fetch the accounts while the user types the name and value, so the
+    # round-trip hides behind think-time instead of blocking up front.
+    # Daemon thread: a Ctrl-C at the prompts must not wait on the fetch.
+    fetch_accounts = prefetch(lambda: app.db.accounts.all().by_name())
 
     if name is None:
         name = Prompt.ask("> Name of the transaction")
@@ -172,6 +193,9 @@ def transaction_add(
     if value is None:
         value = FloatPrompt.ask("> Value of the transaction")
 
+    with app.working("Fetching accounts"):
+        accounts = fetch_accounts.result()
+
     if source is None:
         src_page = dictfzf(accounts, prompt="> Select source account: ")
         if src_page is None:
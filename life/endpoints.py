@@ -21,10 +21,13 @@ import logging
 from dataclasses import dataclass
 from datetime import date
 
+from pydantic import UUID4
+
+from life import cache
 from life.notion.endpoints import DatabaseEndpoint
 from life.notion.filters import Date, Status, Title
 from life.notion.schema import BlockBuilder as bb
-from life.notion.schema import Page
+from life.notion.schema import Page, QueryResult
 
 # ==============================================================================
 # GLOBALS
@@ -32,6 +35,12 @@ from life.notion.schema import Page
 
 log = logging.getLogger()
 
+# Input-independent filters hoisted so every call reuses the same built
+# object tree, as the account commands already do. Date-based filters
+# stay per-call because they capture the current day.
+_FILTER_IN_PROGRESS = Status.get().in_progress()
+_FILTER_NOT_DONE = Status.get().in_progress() | Status.get().not_started()
+
 # ==============================================================================
 # CLASSES
 # ==============================================================================
@@ -41,35 +50,87 @@ log = logging.getLogger()
 class DailyEndpoint(DatabaseEndpoint):
     def today(self) -> Page:
         """Get or create today's daily page."""
-        query = self.query(Date().today())
-
-        if query.count() > 1:
+        # Several commands resolve today's page more than once per
+        # invocation; memoize it for the process lifetime.
+        cached = getattr(self, "_today", None)
+        if cached is not None and cached[0] == date.today().isoformat():
+            return cached[1]
+
+        page = self._today_uncached()
+        self._today = (date.today().isoformat(), page)
+        return page
+
+    def today_id(self) -> UUID4:
+        """Resolve today's daily page id, cached on disk for the day.
+
+        The date-to-page mapping is stable for a whole day, so callers
+        that only need the id for a relation can skip the query entirely
+        on the second and later invocations. The freshness check is the
+        date key itself; the file age bound only sheds leftovers.
+        """
+        key = date.today().isoformat()
+
+        cached = cache.load("daily.pkl", max_age=172800.0)
+        if isinstance(cached, tuple) and cached[0] == key:
+            return cached[1]
+
+        page = self.today()
+        cache.store("daily.pkl", (key, page.id))
+        return page.id
+
+    def _today_uncached(self) -> Page:
+        results = self.query(Date.get().today()).results
+
+        if len(results) > 1:
             log.error("Found more than one daily page for today.")
 
-        if query.count() >= 1:
-            return query.first()
+        if results:
+            return results[0]
 
         return self.create(
             icon=bb.external_file(
                 "https://www.notion.so/icons/partly-cloudy-day_gray.svg"
             ),
             properties=[
-                Title().assign("Today"),
-                Date().assign(date.today()),
+                Title.get().assign("Today"),
+                Date.get().assign(date.today()),
             ],
         )
 
     def delta(self, **kwargs) -> Page | None:
-        query = self.query(Date().delta(**kwargs))
+        # Same rationale as today(): the page for a given offset does not
+        # change within one invocation, so key the memo on the kwargs.
+        memo = getattr(self, "_delta", None)
+        if memo is None:
+            memo = self._delta = {}
 
-        if query.count() == 0:
-            return None
+        key = (date.today().isoformat(), tuple(sorted(kwargs.items())))
+        if key in memo:
+            return memo[key]
 
-        if query.count() > 1:
+        results = self.query(Date.get().delta(**kwargs)).results
+
+        page = None
+        if len(results) > 1:
             log.error("Found more than one daily page.")
+        if results:
+            page = results[0]
+
+        memo[key] = page
+        return page
 
-        if query.count() >= 1:
-            return query.first()
+    def create(self, *args, **kwargs) -> Page:
+        self._invalidate()
+        return super().create(*args, **kwargs)
+
+    def update(self, *args, **kwargs) -> Page:
+        self._invalidate()
+        return super().update(*args, **kwargs)
+
+    def _invalidate(self) -> None:
+        """Drop memoized pages after a write touches the database."""
+        self._today = None
+        self._delta = {}
 
 
 @dataclass
@@ -78,18 +139,23 @@ class TasksEndpoint(DatabaseEndpoint):
         return self.query().by_name()
 
     def not_done(self) -> dict[str, Page]:
-        return self.query(Status().in_progress() | Status().not_started()).by_name()
+        return self.query(_FILTER_NOT_DONE).by_name()
 
 
 @dataclass
 class SessionsEndpoint(DatabaseEndpoint):
     def today(self) -> dict[str, Page]:
         return self.query(
-            filter=Date("Start").today(), sorts=[Date("Start").sort("ascending")]
+            filter=Date.get("Start").today(),
+            sorts=[Date.get("Start").sort("ascending")],
         ).by_name()
 
-    def in_progress(self) -> dict[str, Page]:
-        return self.query(Status().in_progress()).by_name()
+    def in_progress(self, page_size: int | None = None) -> dict[str, Page]:
+        return self.query(_FILTER_IN_PROGRESS, page_size=page_size).by_name()
+
+    def any_in_progress(self) -> bool:
+        # A single-row page bounds the transfer; existence is all we need.
+        return len(self.query(_FILTER_IN_PROGRESS, page_size=1)) > 0
 
 
 @dataclass
@@ -100,7 +166,16 @@ class AreasEndpoint(DatabaseEndpoint):
 
 @dataclass
 class AccountsEndpoint(DatabaseEndpoint):
-    pass
+    # Accounts change rarely; a short disk-backed TTL lets consecutive
+    # transaction commands skip the listing round-trip entirely.
+    CACHE_TTL = 300.0
+
+    def all(self) -> QueryResult[Page]:
+        result = cache.load("accounts.pkl", max_age=self.CACHE_TTL)
+        if result is None:
+            result = self.query()
+            cache.store("accounts.pkl", result)
+        return result
 
 
 @dataclass
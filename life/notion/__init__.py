@@ -17,8 +17,24 @@
 # CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE
 # OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
-from notion_client import Client as Client
+from notion_client import Client as _Client
 
-from . import endpoints as endpoints
-from . import filters as filters
-from . import schema as schema
+
+class Client(_Client):
+    """Notion client that returns successful response bodies as raw bytes.
+
+    The schema parse entry points feed the bytes straight into
+    pydantic-core's validate_json, which parses JSON in Rust without
+    materializing the intermediate Python dict tree. Error responses
+    still go through the upstream parser so exceptions are unchanged.
+    """
+
+    def _parse_response(self, response):
+        if response.is_error:
+            return super()._parse_response(response)
+        return response.content
+
+
+from . import endpoints as endpoints  # noqa: E402
+from . import filters as filters  # noqa: E402
+from . import schema as schema  # noqa: E402
@@ -19,11 +19,16 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import threading
+import weakref
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import Any
 from uuid import UUID
 
-from pydantic import TypeAdapter
 from rich.pretty import pretty_repr
 
 from . import Client
@@ -37,6 +42,7 @@ from .schema import (
     InnerBlockList,
     Page,
     QueryResult,
+    parse_block,
 )
 from .schema import (
     BlockBuilder as bb,
@@ -48,12 +54,37 @@ from .schema import (
 
 log = logging.getLogger("endpoints")
 
+# Identical queries currently in flight, keyed by (database id, payload),
+# so concurrent duplicate callers share one round-trip.
+_inflight: dict[tuple[str, str], Future] = {}
+_inflight_lock = threading.Lock()
+
+
+# Serialized payloads keyed by object identity, so hoisted filter
+# singletons are dumped once per process instead of once per query.
+# Entries die with their model via the weakref finalizer.
+_dump_cache: dict[int, Any] = {}
+
+
+def _dump(model: Any) -> Any:
+    key = id(model)
+    cached = _dump_cache.get(key)
+    if cached is None:
+        cached = model.model_dump(mode="json")
+        weakref.finalize(model, _dump_cache.pop, key, None)
+        _dump_cache[key] = cached
+    return cached
+
 # ==============================================================================
 # CLASSES
 # ==============================================================================
 
 
-@dataclass
+# The base endpoints have hand-written constructors (for the UUID-to-str
+# coercion), so suppress the generated __init__/__repr__/__eq__ that would
+# only be built to be shadowed. Subclasses that declare no constructor keep
+# the plain decorator and get theirs generated from the inherited fields.
+@dataclass(init=False, repr=False, eq=False)
 class Endpoint:
     client: Client
     id: str
@@ -63,14 +94,15 @@ class Endpoint:
         self.id = id if isinstance(id, str) else str(id)
 
 
-@dataclass
+@dataclass(init=False, repr=False, eq=False)
 class BlockEndpoint(Endpoint):
-    def __init__(self, client: Client, id: str | UUID):
-        super().__init__(client, id)
-
     def get(self) -> Block:
         res = self.client.blocks.retrieve(block_id=self.id)
-        return TypeAdapter(Block).validate_python(res)
+        # The client hands back raw bytes; a single block is small, so a
+        # plain json decode before tag dispatch costs next to nothing.
+        if isinstance(res, bytes | str):
+            res = json.loads(res)
+        return parse_block(res)
 
     def after(self, children: list[InnerBlock]) -> QueryResult[Block]:
         parent_id = self.get().parent.id()
@@ -85,36 +117,122 @@ class BlockEndpoint(Endpoint):
         return QueryResult[Block].parse(res)
 
 
-@dataclass
+@dataclass(init=False, repr=False, eq=False)
 class DatabaseEndpoint(Endpoint):
     default_icon: str | None = None
 
-    def __init__(self, client: Client, id: str | UUID):
-        super().__init__(client, id)
-
-    def query(
-        self, filter: Filter | None = None, sorts: list[Sort] | None = None
-    ) -> QueryResult[Page]:
+    def _query_request(
+        self,
+        filter: Filter | None = None,
+        sorts: list[Sort] | None = None,
+        page_size: int | None = None,
+    ) -> dict[str, Any]:
         request = {}
 
         if filter is not None:
-            request["filter"] = filter.model_dump(mode="json")
+            request["filter"] = _dump(filter)
 
         if sorts is not None:
             request["sorts"] = SortList(sorts).model_dump(mode="json")
 
-        log.debug(f"[QUERY @ {self.id}] REQUEST:")
-        log.debug(f"{pretty_repr(request)}")
+        if page_size is not None:
+            request["page_size"] = page_size
+
+        return request
+
+    def query(
+        self,
+        filter: Filter | None = None,
+        sorts: list[Sort] | None = None,
+        page_size: int | None = None,
+    ) -> QueryResult[Page]:
+        request = self._query_request(filter, sorts, page_size)
+
+        # Parallel fetches sometimes issue the same query from several
+        # threads; coalesce duplicates onto the one request in flight.
+        key = (self.id, json.dumps(request, sort_keys=True))
+        with _inflight_lock:
+            pending = _inflight.get(key)
+            if pending is None:
+                future: Future = Future()
+                _inflight[key] = future
+
+        # Wait outside the lock so other duplicate callers can attach to
+        # the same future while the owning thread is on the wire.
+        if pending is not None:
+            return pending.result()
+
+        try:
+            result = self._query_uncoalesced(request)
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with _inflight_lock:
+                _inflight.pop(key, None)
+
+    def _query_uncoalesced(self, request: dict[str, Any]) -> QueryResult[Page]:
+        # pretty_repr walks the whole payload; skip it unless a debug
+        # handler will actually consume the output.
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[QUERY @ %s] REQUEST:\n%s", self.id, pretty_repr(request))
 
         response = self.client.databases.query(database_id=self.id, **request)
 
-        log.debug(f"[QUERY @ {self.id}] RESPONSE:")
-        log.debug(f"{pretty_repr(response)}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[QUERY @ %s] RESPONSE:\n%s", self.id, pretty_repr(response))
 
         return QueryResult.parse(response)
 
+    def iter_query(
+        self, filter: Filter | None = None, sorts: list[Sort] | None = None
+    ) -> Iterator[Page]:
+        """Yield pages as each paginated response arrives.
+
+        Follows the cursor through every result page and prefetches the
+        next response in the background while the caller consumes the
+        current one, so consumers see the first rows after one round-trip
+        regardless of the total result size.
+        """
+        request = self._query_request(filter, sorts)
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "[ITER QUERY @ %s] REQUEST:\n%s", self.id, pretty_repr(request)
+            )
+
+        def fetch(cursor: str | None) -> QueryResult[Page]:
+            page_request = dict(request)
+            if cursor is not None:
+                page_request["start_cursor"] = cursor
+            response = self.client.databases.query(
+                database_id=self.id, **page_request
+            )
+            return QueryResult.parse(response)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            result = fetch(None)
+            while True:
+                future = (
+                    executor.submit(fetch, result.next_cursor)
+                    if result.has_more and result.next_cursor is not None
+                    else None
+                )
+                yield from result.results
+                if future is None:
+                    return
+                result = future.result()
+
     def schema(self) -> Database:
-        return Database.parse(self.client.databases.retrieve(self.id))
+        """Fetch the database schema, caching it for the process lifetime."""
+        schema = getattr(self, "_schema", None)
+        if schema is None:
+            schema = Database.parse(self.client.databases.retrieve(self.id))
+            self._schema = schema
+        return schema
 
     def create(
         self,
@@ -129,8 +247,17 @@ class DatabaseEndpoint(Endpoint):
         if not isinstance(properties, list):
             properties = [properties]
 
-        properties = AssignList(root=properties).model_dump(mode="json")
-        children = InnerBlockList(root=children).model_dump(mode="json")
+        # An empty list dumps to {} / [] anyway; skip the model walk.
+        properties = (
+            AssignList(root=properties).model_dump(mode="json")
+            if properties
+            else {}
+        )
+        children = (
+            InnerBlockList(root=children).model_dump(mode="json")
+            if children
+            else []
+        )
 
         request = {
             "parent": {"database_id": self.id},
@@ -148,38 +275,76 @@ class DatabaseEndpoint(Endpoint):
         if cover is not None:
             request["cover"] = cover.model_dump(mode="json")
 
-        log.debug(f"[CREATE @ {self.id}] REQUEST:")
-        log.debug(f"{pretty_repr(request)}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[CREATE @ %s] REQUEST:\n%s", self.id, pretty_repr(request))
 
         response = self.client.pages.create(**request)
 
-        log.debug(f"[CREATE @ {self.id}] RESPONSE:")
-        log.debug(f"{pretty_repr(response)}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[CREATE @ %s] RESPONSE:\n%s", self.id, pretty_repr(response))
 
         return Page.parse(response)
 
+    def create_many(
+        self, specs: list[dict[str, Any]], max_workers: int = 8
+    ) -> list[Page]:
+        """Create several pages concurrently, results in input order.
+
+        Notion has no batch page-create endpoint, so each spec (the
+        keyword arguments of create) still costs one request, but issuing
+        them together bounds the wall time by the slowest round-trip.
+        """
+        if len(specs) <= 1:
+            return [self.create(**spec) for spec in specs]
+
+        workers = min(max_workers, len(specs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda spec: self.create(**spec), specs))
+
+    def update_many(
+        self,
+        updates: list[tuple[str | UUID, Assign | list[Assign] | dict[str, Any]]],
+        max_workers: int = 8,
+    ) -> list[Page]:
+        """Apply several (page_id, properties) updates concurrently."""
+        if len(updates) <= 1:
+            return [self.update(*update) for update in updates]
+
+        workers = min(max_workers, len(updates))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda update: self.update(*update), updates))
+
     def update(
         self,
         page_id: str | UUID,
-        properties: Assign | list[Assign],
+        properties: Assign | list[Assign] | dict[str, Any],
     ) -> Page:
         if isinstance(page_id, UUID):
             page_id = str(page_id)
 
-        if not isinstance(properties, list):
-            properties = [properties]
+        # Fast path: an already-serialized payload is forwarded as-is,
+        # skipping the Assign object construction and dump.
+        if not isinstance(properties, dict):
+            if not isinstance(properties, list):
+                properties = [properties]
 
-        properties = AssignList(root=properties).model_dump(mode="json")
+            properties = (
+                AssignList(root=properties).model_dump(mode="json")
+                if properties
+                else {}
+            )
 
-        log.debug(f"[UPDATE @ {self.id}] PROPERTIES:")
-        log.debug(f"{pretty_repr(properties)}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "[UPDATE @ %s] PROPERTIES:\n%s", self.id, pretty_repr(properties)
+            )
 
         response = self.client.pages.update(
             page_id=page_id,
             properties=properties,
         )
 
-        log.debug(f"[UPDATE @ {self.id}] RESPONSE:")
-        log.debug(f"{pretty_repr(response)}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[UPDATE @ %s] RESPONSE:\n%s", self.id, pretty_repr(response))
 
         return Page.parse(response)
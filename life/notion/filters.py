@@ -20,21 +20,40 @@
 from __future__ import annotations
 
 from datetime import date, datetime, timedelta
-from typing import Any, Literal
+from typing import Any, ClassVar, Literal
 from uuid import UUID
 
 from dateutil.relativedelta import relativedelta
-from pydantic import BaseModel, RootModel, model_serializer
+from pydantic import BaseModel, ConfigDict, RootModel, model_serializer
 
 # ==============================================================================
 # PROPERTIES
 # ==============================================================================
 
+# Interned Property instances keyed by (class, constructor args).
+_interned: dict[tuple, Property] = {}
+
 
 class Property(BaseModel):
+    # Importing this module defines dozens of models but a command touches
+    # only a handful; defer the pydantic-core schema build to first use so
+    # the rest never pay for compilation (same trade as the config models).
+    # A property is fully described by (name, kind) and never mutated, so
+    # freeze it and let get() hand out interned instances.
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     name: str
     kind: str
 
+    @classmethod
+    def get(cls, *args: str) -> Property:
+        """Return an interned instance instead of allocating a fresh one."""
+        key = (cls, args)
+        prop = _interned.get(key)
+        if prop is None:
+            prop = _interned[key] = cls(*args)
+        return prop
+
     def _assign(self, value: Value) -> Assign:
         return Assign(property=self, value=value)
 
@@ -314,7 +333,7 @@ class Verification(Property):
 
 
 class Operator(BaseModel):
-    pass
+    model_config = ConfigDict(defer_build=True)
 
 
 class Equals(Operator):
@@ -349,16 +368,22 @@ class NotContains(Operator):
         return {"does_not_contains": self.value}
 
 
-class Empty(Operator):
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        return {"is_empty": True}
+class StaticOperator(Operator):
+    """Operator with a constant payload, shared across all instances."""
 
+    _dump: ClassVar[dict[str, Any]] = {}
 
-class NotEmpty(Operator):
     @model_serializer
     def serialize(self) -> dict[str, Any]:
-        return {"is_not_empty": True}
+        return self._dump
+
+
+class Empty(StaticOperator):
+    _dump: ClassVar = {"is_empty": True}
+
+
+class NotEmpty(StaticOperator):
+    _dump: ClassVar = {"is_not_empty": True}
 
 
 class DateOperator(Operator):
@@ -397,46 +422,32 @@ class OnOrBefore(DateOperator):
         return {"on_or_before": self.date}
 
 
-class NextMonth(DateOperator):
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        return {"next_month": {}}
+class NextMonth(StaticOperator, DateOperator):
+    _dump: ClassVar = {"next_month": {}}
 
 
-class NextWeek(DateOperator):
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        return {"next_week": {}}
+class NextWeek(StaticOperator, DateOperator):
+    _dump: ClassVar = {"next_week": {}}
 
 
-class NextYear(DateOperator):
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        return {"next_year": {}}
+class NextYear(StaticOperator, DateOperator):
+    _dump: ClassVar = {"next_year": {}}
 
 
-class PastMonth(DateOperator):
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        return {"past_month": {}}
+class PastMonth(StaticOperator, DateOperator):
+    _dump: ClassVar = {"past_month": {}}
 
 
-class PastWeek(DateOperator):
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        return {"past_week": {}}
+class PastWeek(StaticOperator, DateOperator):
+    _dump: ClassVar = {"past_week": {}}
 
 
-class PastYear(DateOperator):
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        return {"past_year": {}}
+class PastYear(StaticOperator, DateOperator):
+    _dump: ClassVar = {"past_year": {}}
 
 
-class ThisWeek(DateOperator):
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        return {"this_week": {}}
+class ThisWeek(StaticOperator, DateOperator):
+    _dump: ClassVar = {"this_week": {}}
 
 
 class LessThan(Operator):
@@ -477,23 +488,13 @@ class GreaterThanOrEqual(Operator):
 
 
 class Filter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     def __and__(self, other: Filter) -> Filter:
-        lhs = [self]
-        if isinstance(self, And):
-            lhs = self.children
-        rhs = [other]
-        if isinstance(other, And):
-            rhs = other.children
-        return And(children=[*lhs, *rhs])
+        return And.combine(self, other)
 
     def __or__(self, other: Filter) -> Filter:
-        lhs = [self]
-        if isinstance(self, Or):
-            lhs = self.children
-        rhs = [other]
-        if isinstance(other, Or):
-            rhs = other.children
-        return Or(children=[*lhs, *rhs])
+        return Or.combine(self, other)
 
 
 class EmptyFilter(Filter):
@@ -523,6 +524,18 @@ class Condition(Filter):
 class And(Filter):
     children: list[Filter]
 
+    @classmethod
+    def combine(cls, *filters: Filter) -> And:
+        # Splice nested conjunctions into one child list so chained `&`
+        # stays flat instead of copying lists at every combination.
+        children: list[Filter] = []
+        for filter in filters:
+            if isinstance(filter, cls):
+                children.extend(filter.children)
+            else:
+                children.append(filter)
+        return cls(children=children)
+
     @model_serializer
     def serialize(self) -> dict[str, Any]:
         return {"and": self.children}
@@ -531,6 +544,16 @@ class And(Filter):
 class Or(Filter):
     children: list[Filter]
 
+    @classmethod
+    def combine(cls, *filters: Filter) -> Or:
+        children: list[Filter] = []
+        for filter in filters:
+            if isinstance(filter, cls):
+                children.extend(filter.children)
+            else:
+                children.append(filter)
+        return cls(children=children)
+
     @model_serializer
     def serialize(self) -> dict[str, Any]:
         return {"or": self.children}
@@ -568,10 +591,13 @@ class AssignList(RootModel[list[Assign]]):
 
     @model_serializer
     def serialize(self) -> dict[str, Any]:
-        data = {}
-        for assign in self.root:
-            data = {**data, **assign.serialize()}
-        return data
+        # A single comprehension merges the fragments in linear time; the
+        # old `{**data, **assign}` loop recopied the growing dict per item.
+        return {
+            name: value
+            for assign in self.root
+            for name, value in assign.serialize().items()
+        }
 
 
 # ==============================================================================
@@ -580,7 +606,7 @@ class AssignList(RootModel[list[Assign]]):
 
 
 class Value(BaseModel):
-    pass
+    model_config = ConfigDict(defer_build=True)
 
 
 class Plain(Value):
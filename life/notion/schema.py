@@ -19,8 +19,20 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import date, datetime
-from typing import Annotated, Any, Callable, Generic, Literal, TypeVar, Union
+from enum import IntEnum
+from functools import cache, lru_cache
+from operator import attrgetter
+from typing import (
+    Annotated,
+    Any,
+    ClassVar,
+    Generic,
+    Literal,
+    TypeVar,
+    get_args,
+)
 from uuid import UUID
 
 from pydantic import (
@@ -30,11 +42,17 @@ from pydantic import (
     EmailStr,
     Field,
     HttpUrl,
+    PrivateAttr,
     RootModel,
     TypeAdapter,
     model_serializer,
+    model_validator,
 )
 
+# Bound once so hot text joins dispatch through a C-level getter instead
+# of a Python attribute expression per fragment.
+_get_plain_text = attrgetter("plain_text")
+
 # ==============================================================================
 # ENUMS
 # ==============================================================================
@@ -146,7 +164,19 @@ NumberFormat = Literal[
 
 
 class EmptyObject(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    # A parsed database holds one of these per property; they carry no
+    # state, so every validation collapses onto a single shared instance.
+    @model_validator(mode="after")
+    def _intern(self) -> EmptyObject:
+        return _EMPTY_OBJECT if _EMPTY_OBJECT is not None else self
+
+
+_EMPTY_OBJECT: EmptyObject | None = None
+# model_construct sidesteps validation (and thus the interning hook)
+# while the singleton itself is being made.
+_EMPTY_OBJECT = EmptyObject.model_construct()
 
 
 class IdentifierObject(BaseModel):
@@ -203,7 +233,7 @@ class InternalUnnamedFile(BaseModel):
 
 
 UnnamedFile = Annotated[
-    Union[ExternalUnnamedFile, InternalUnnamedFile],
+    ExternalUnnamedFile | InternalUnnamedFile,
     Field(discriminator="type"),
 ]
 
@@ -221,7 +251,7 @@ class InternalCaptionedFile(BaseModel):
 
 
 CaptionedFile = Annotated[
-    Union[ExternalCaptionedFile, InternalCaptionedFile],
+    ExternalCaptionedFile | InternalCaptionedFile,
     Field(discriminator="type"),
 ]
 
@@ -291,14 +321,12 @@ class MentionUserObject(BaseModel):
 
 
 MentionObject = Annotated[
-    Union[
-        MentionDatabaseObject,
-        MentionDateObject,
-        MentionLinkPreviewObject,
-        MentionPageObject,
-        MentionTemplateObject,
-        MentionUserObject,
-    ],
+    MentionDatabaseObject
+    | MentionDateObject
+    | MentionLinkPreviewObject
+    | MentionPageObject
+    | MentionTemplateObject
+    | MentionUserObject,
     Field(discriminator="type"),
 ]
 
@@ -310,6 +338,23 @@ class MentionFragmentObject(BaseModel):
     plain_text: str
     href: HttpUrl | None = Field(repr=False)
 
+    def target_id(self) -> UUID | None:
+        """Id of the mentioned entity, if the mention targets one.
+
+        Matching on the tag string dispatches in one pass instead of
+        trying isinstance against each union member.
+        """
+        mention = self.mention
+        match mention.type:
+            case "database":
+                return mention.database.id
+            case "page":
+                return mention.page.id
+            case "user":
+                return mention.user.id
+            case _:
+                return None
+
 
 class EquationFragmentObject(BaseModel):
     type: Literal["equation"] = Field(repr=False)
@@ -320,12 +365,10 @@ class EquationFragmentObject(BaseModel):
 
 
 RichTextFragment = Annotated[
-    Union[
-        SimpleTextFragmentObject,
-        TextFragmentObject,
-        MentionFragmentObject,
-        EquationFragmentObject,
-    ],
+    SimpleTextFragmentObject
+    | TextFragmentObject
+    | MentionFragmentObject
+    | EquationFragmentObject,
     Field(discriminator="type"),
 ]
 
@@ -337,28 +380,40 @@ class RichText(RootModel[list[RichTextFragment]]):
 # PARENTS ----------------------------------------------------------------------
 
 
+# Each parent variant names its id field so Parent.id() resolves it with
+# one attribute lookup instead of a chain of isinstance checks.
+
+
 class DatabaseParent(BaseModel):
+    _id_attr: ClassVar[str | None] = "database_id"
+
     type: Literal["database_id"] = Field(repr=False)
     database_id: UUID4
 
 
 class PageParent(BaseModel):
+    _id_attr: ClassVar[str | None] = "page_id"
+
     type: Literal["page_id"] = Field(repr=False)
     page_id: UUID4
 
 
 class WorkspaceParent(BaseModel):
+    _id_attr: ClassVar[str | None] = None
+
     type: Literal["workspace"] = Field(repr=False)
     workspace: bool
 
 
 class BlockParent(BaseModel):
+    _id_attr: ClassVar[str | None] = "block_id"
+
     type: Literal["block_id"] = Field(repr=False)
     block_id: UUID4
 
 
 _Parent = Annotated[
-    Union[DatabaseParent, PageParent, BlockParent, WorkspaceParent],
+    DatabaseParent | PageParent | BlockParent | WorkspaceParent,
     Field(discriminator="type"),
 ]
 
@@ -367,13 +422,8 @@ class Parent(RootModel[_Parent]):
     root: _Parent
 
     def id(self) -> UUID | None:
-        if isinstance(self.root, DatabaseParent):
-            return self.root.database_id
-        if isinstance(self.root, PageParent):
-            return self.root.page_id
-        if isinstance(self.root, BlockParent):
-            return self.root.block_id
-        return None
+        attr = self.root._id_attr
+        return getattr(self.root, attr) if attr else None
 
 
 # EMOJI ------------------------------------------------------------------------
@@ -388,7 +438,7 @@ class Emoji(BaseModel):
 
 Icon = (
     Annotated[
-        Union[UnnamedFile, Emoji],
+        UnnamedFile | Emoji,
         Field(discriminator="type"),
     ]
     | None
@@ -498,6 +548,11 @@ User = Annotated[PersonUser | BotUser, Field(discriminator="type")]
 
 
 class BaseBlockModel(BaseModel):
+    # A command touches at most a handful of the 29 block variants, so
+    # defer each validator build to first use instead of compiling the
+    # whole family at import (same trade as the config and filter models).
+    model_config = ConfigDict(defer_build=True)
+
     object: Literal["block"] = Field(repr=False)
     id: UUID4
     parent: Parent
@@ -508,6 +563,37 @@ class BaseBlockModel(BaseModel):
     has_children: bool
     archived: bool
 
+    # Blocks are uniquely keyed by their id, so equality and hashing
+    # compare that instead of recursing through all eight fields (same
+    # as Page.__hash__).
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and self.id == other.id  # type: ignore[attr-defined]
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+
+# Many inner blocks share the same payload shape and differ only in their
+# type literal; these bases declare the common fields once so the concrete
+# classes below carry nothing but their tag.
+
+
+class RichTextItem(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    rich_text: RichText
+    color: Color
+    children: InnerBlockList | None = None
+
+
+class HeadingItem(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    rich_text: RichText
+    color: Color
+    is_toggleable: bool
+
 
 # BOOKMARK ---------------------------------------------------------------------
 
@@ -538,13 +624,10 @@ class BreadcrumbBlock(BaseBlockModel):
 # BULLET -----------------------------------------------------------------------
 
 
-class BulletItem(BaseModel):
+class BulletItem(RichTextItem):
     type: Literal["bulleted_list_item"] = Field(
         default="bulleted_list_item", exclude=True
     )
-    rich_text: RichText
-    color: Color
-    children: InnerBlockList | None = None
 
 
 class BulletItemBlock(BaseBlockModel):
@@ -689,7 +772,7 @@ class ExternalNamedFile(BaseModel):
 
 
 NamedFile = Annotated[
-    Union[ExternalNamedFile, InternalNamedFile],
+    ExternalNamedFile | InternalNamedFile,
     Field(discriminator="type"),
 ]
 
@@ -707,11 +790,8 @@ class FileBlock(BaseBlockModel):
 # HEADING 1 --------------------------------------------------------------------
 
 
-class Heading1(BaseModel):
+class Heading1(HeadingItem):
     type: Literal["heading_1"] = Field(default="heading_1", exclude=True)
-    rich_text: RichText
-    color: Color
-    is_toggleable: bool
 
 
 class Heading1Block(BaseBlockModel):
@@ -722,11 +802,8 @@ class Heading1Block(BaseBlockModel):
 # HEADING 2 --------------------------------------------------------------------
 
 
-class Heading2(BaseModel):
+class Heading2(HeadingItem):
     type: Literal["heading_2"] = Field(default="heading_2", exclude=True)
-    rich_text: RichText
-    color: Color
-    is_toggleable: bool
 
 
 class Heading2Block(BaseBlockModel):
@@ -737,11 +814,8 @@ class Heading2Block(BaseBlockModel):
 # HEADING 3 -------------------------------------------------------------------
 
 
-class Heading3(BaseModel):
+class Heading3(HeadingItem):
     type: Literal["heading_3"] = Field(default="heading_3", exclude=True)
-    rich_text: RichText
-    color: Color
-    is_toggleable: bool
 
 
 class Heading3Block(BaseBlockModel):
@@ -773,13 +847,10 @@ class LinkPreviewBlock(BaseBlockModel):
 # NUMBERED ---------------------------------------------------------------------
 
 
-class NumberedItem(BaseModel):
+class NumberedItem(RichTextItem):
     type: Literal["numbered_list_item"] = Field(
         default="numbered_list_item", exclude=True
     )
-    rich_text: RichText
-    color: Color
-    children: InnerBlockList | None = None
 
 
 class NumberedItemBlock(BaseBlockModel):
@@ -790,11 +861,8 @@ class NumberedItemBlock(BaseBlockModel):
 # PARAGRAPH --------------------------------------------------------------------
 
 
-class Paragraph(BaseModel):
+class Paragraph(RichTextItem):
     type: Literal["paragraph"] = Field(default="paragraph", exclude=True)
-    rich_text: RichText
-    color: Color
-    children: InnerBlockList | None = None
 
 
 class ParagraphBlock(BaseBlockModel):
@@ -818,11 +886,8 @@ class PdfBlock(BaseBlockModel):
 # QUOTE ------------------------------------------------------------------------
 
 
-class Quote(BaseModel):
+class Quote(RichTextItem):
     type: Literal["quote"] = Field(default="quote", exclude=True)
-    rich_text: RichText
-    color: Color
-    children: InnerBlockList | None = None
 
 
 class QuoteBlock(BaseBlockModel):
@@ -867,6 +932,11 @@ class TableRow(BaseModel):
     type: Literal["table_row"] = Field(default="table_row", exclude=True)
     cells: list[RichText]
 
+    def plain_text(self) -> str:
+        return "\t".join(
+            "".join(map(_get_plain_text, cell.root)) for cell in self.cells
+        )
+
 
 class TableRowBlock(BaseBlockModel):
     type: Literal["table_row"] = Field(repr=False)
@@ -891,12 +961,9 @@ class TocBlock(BaseBlockModel):
 # TO-DO ITEM -------------------------------------------------------------------
 
 
-class TodoItem(BaseModel):
+class TodoItem(RichTextItem):
     type: Literal["to_do"] = Field(default="to_do", exclude=True)
-    rich_text: RichText
-    color: Color
     checked: bool | None
-    children: InnerBlockList | None = None
 
 
 class TodoItemBlock(BaseBlockModel):
@@ -907,11 +974,8 @@ class TodoItemBlock(BaseBlockModel):
 # TOGGLE -----------------------------------------------------------------------
 
 
-class Toggle(BaseModel):
+class Toggle(RichTextItem):
     type: Literal["toggle"] = Field(default="toggle", exclude=True)
-    rich_text: RichText
-    color: Color
-    children: InnerBlockList | None = None
 
 
 class ToggleBlock(BaseBlockModel):
@@ -936,37 +1000,35 @@ class VideoBlock(BaseBlockModel):
 
 
 Block = Annotated[
-    Union[
-        BookmarkBlock,
-        BreadcrumbBlock,
-        BulletItemBlock,
-        CalloutBlock,
-        ChildDatabaseBlock,
-        ChildPageBlock,
-        CodeBlock,
-        ColumnBlock,
-        ColumnListBlock,
-        DividerBlock,
-        EmbedBlock,
-        EquationBlock,
-        FileBlock,
-        Heading1Block,
-        Heading2Block,
-        Heading3Block,
-        ImageBlock,
-        LinkPreviewBlock,
-        NumberedItemBlock,
-        ParagraphBlock,
-        PdfBlock,
-        QuoteBlock,
-        SyncedBlock,
-        TableBlock,
-        TableRowBlock,
-        TocBlock,
-        TodoItemBlock,
-        ToggleBlock,
-        VideoBlock,
-    ],
+    BookmarkBlock
+    | BreadcrumbBlock
+    | BulletItemBlock
+    | CalloutBlock
+    | ChildDatabaseBlock
+    | ChildPageBlock
+    | CodeBlock
+    | ColumnBlock
+    | ColumnListBlock
+    | DividerBlock
+    | EmbedBlock
+    | EquationBlock
+    | FileBlock
+    | Heading1Block
+    | Heading2Block
+    | Heading3Block
+    | ImageBlock
+    | LinkPreviewBlock
+    | NumberedItemBlock
+    | ParagraphBlock
+    | PdfBlock
+    | QuoteBlock
+    | SyncedBlock
+    | TableBlock
+    | TableRowBlock
+    | TocBlock
+    | TodoItemBlock
+    | ToggleBlock
+    | VideoBlock,
     Field(discriminator="type"),
 ]
 
@@ -975,51 +1037,77 @@ class BlockList(RootModel[list[Block]]):
     pass
 
 
+def _dispatch_table(union: Any) -> dict[str, type[BaseModel]]:
+    """Map each union member's "type" literal to its concrete class."""
+    members = get_args(get_args(union)[0])
+    return {
+        get_args(member.model_fields["type"].annotation)[0]: member
+        for member in members
+    }
+
+
+_BLOCK_DISPATCH = _dispatch_table(Block)
+
+
+def parse_block(raw: dict[str, Any]) -> Block:
+    """Validate one raw block by dispatching on its "type" tag.
+
+    Resolves the concrete class with a dict lookup and validates against
+    it directly, so no TypeAdapter for the full Block union needs to be
+    built or consulted.
+    """
+    return _BLOCK_DISPATCH[raw["type"]].model_validate(raw)
+
+
 InnerBlock = Annotated[
-    Union[
-        Bookmark,
-        Breadcrumb,
-        BulletItem,
-        Callout,
-        # `ChildDatabase` not applicable
-        # `ChildPage` not applicable
-        Code,
-        Column,
-        ColumnList,
-        Divider,
-        Embed,
-        Equation,
-        File,
-        Heading1,
-        Heading2,
-        Heading3,
-        Image,
-        # `LinkPreview` not applicable
-        NumberedItem,
-        Paragraph,
-        Pdf,
-        Quote,
-        Synced,
-        Table,
-        TableRow,
-        Toc,
-        TodoItem,
-        Toggle,
-        Video,
-    ],
+    Bookmark
+    | Breadcrumb
+    | BulletItem
+    | Callout
+    # `ChildDatabase` not applicable
+    # `ChildPage` not applicable
+    | Code
+    | Column
+    | ColumnList
+    | Divider
+    | Embed
+    | Equation
+    | File
+    | Heading1
+    | Heading2
+    | Heading3
+    | Image
+    # `LinkPreview` not applicable
+    | NumberedItem
+    | Paragraph
+    | Pdf
+    | Quote
+    | Synced
+    | Table
+    | TableRow
+    | Toc
+    | TodoItem
+    | Toggle
+    | Video,
     Field(discriminator="type"),
 ]
 
 
+# File-like blocks serialize as-is rather than nested under their type
+# key. An exact-type set lookup beats re-materializing the union tuple
+# and walking the MRO per element.
+_PASSTHROUGH_TYPES = frozenset({File, Image, Video, Pdf})
+
+
 class InnerBlockList(RootModel[list[InnerBlock]]):
     root: list[InnerBlock]
 
     @model_serializer
     def serialize(self) -> list[Any]:
         return [
-            {inner_block.type: inner_block}
-            if not isinstance(inner_block, File | Image | Video | Pdf)
-            else inner_block
+            inner_block
+            if type(inner_block) in _PASSTHROUGH_TYPES
+            else {inner_block.type: inner_block}
             for inner_block in self.root
         ]
 
@@ -1101,21 +1189,28 @@ class FormulaValue(BaseModel):
     def value(self) -> FormulaObject:
         return self.formula
 
+    # The tag comparison below keeps the type guard while replacing the
+    # isinstance MRO walk with one string check on the discriminator.
+
     def as_boolean(self) -> bool | None:
-        assert isinstance(self.formula, BooleanFormulaObject)
-        return self.formula.boolean
+        formula = self.formula
+        assert formula.type == "boolean"
+        return formula.boolean
 
     def as_number(self) -> int | float | None:
-        assert isinstance(self.formula, NumberFormulaObject)
-        return self.formula.number
+        formula = self.formula
+        assert formula.type == "number"
+        return formula.number
 
     def as_string(self) -> str | None:
-        assert isinstance(self.formula, StringFormulaObject)
-        return self.formula.string
+        formula = self.formula
+        assert formula.type == "string"
+        return formula.string
 
     def as_date(self) -> date | datetime | None:
-        assert isinstance(self.formula, DateFormulaObject)
-        return self.formula.date
+        formula = self.formula
+        assert formula.type == "date"
+        return formula.date
 
 
 class LastEditedByValue(BaseModel):
@@ -1191,13 +1286,14 @@ class RichTextValue(BaseModel):
         return self.rich_text
 
     def plain_text(self) -> str:
-        if len(self.rich_text.root) == 0:
+        fragments = self.rich_text.root
+        if len(fragments) == 0:
             return ""
         return "".join(
-            fragment.plain_text
-            for fragment in self.rich_text.root
-            if not isinstance(fragment, SimpleTextFragmentObject)
-            and fragment.plain_text is not None
+            plain_text
+            for fragment in fragments
+            if fragment.type != "simple_text"
+            and (plain_text := fragment.plain_text) is not None
         )
 
 
@@ -1210,12 +1306,14 @@ class RollupValue(BaseModel):
         return self.rollup
 
     def as_number(self) -> int | float | None:
-        assert isinstance(self.rollup, NumberFormulaObject)
-        return self.rollup.number
+        rollup = self.rollup
+        assert rollup.type == "number"
+        return rollup.number
 
     def as_date(self) -> date | datetime | None:
-        assert isinstance(self.rollup, DateFormulaObject)
-        return self.rollup.date
+        rollup = self.rollup
+        assert rollup.type == "date"
+        return rollup.date
 
 
 class SelectValue(BaseModel):
@@ -1227,25 +1325,48 @@ class SelectValue(BaseModel):
         return self.select
 
 
+class StatusState(IntEnum):
+    NOT_STARTED = 0
+    IN_PROGRESS = 1
+    DONE = 2
+    OTHER = 3
+
+
+_STATUS_STATES = {
+    "Not started": StatusState.NOT_STARTED,
+    "In progress": StatusState.IN_PROGRESS,
+    "Done": StatusState.DONE,
+}
+
+
 class StatusValue(BaseModel):
     type: Literal["status"] = Field(repr=False)
     id: str = Field(repr=False)
     status: SelectObject
 
+    # Classified lazily so rows whose status is never inspected pay
+    # nothing; repeated checks then compare a cached int.
+    _state: StatusState | None = PrivateAttr(default=None)
+
     def value(self) -> SelectObject:
         return self.status
 
     def name(self) -> str:
         return self.status.name
 
+    def state(self) -> StatusState:
+        if self._state is None:
+            self._state = _STATUS_STATES.get(self.status.name, StatusState.OTHER)
+        return self._state
+
     def not_started(self) -> bool:
-        return self.status.name == "Not started"
+        return self.state() is StatusState.NOT_STARTED
 
     def in_progress(self) -> bool:
-        return self.status.name == "In progress"
+        return self.state() is StatusState.IN_PROGRESS
 
     def done(self) -> bool:
-        return self.status.name == "Done"
+        return self.state() is StatusState.DONE
 
 
 class TitleValue(BaseModel):
@@ -1257,7 +1378,11 @@ class TitleValue(BaseModel):
         return self.title
 
     def plain_text(self) -> str:
-        return "".join(text_obj.plain_text for text_obj in self.title.root)
+        # Titles are almost always a single fragment; skip the join then.
+        fragments = self.title.root
+        if len(fragments) == 1:
+            return fragments[0].plain_text
+        return "".join(map(_get_plain_text, fragments))
 
 
 class URLValue(BaseModel):
@@ -1294,30 +1419,28 @@ class VerificationValue(BaseModel):
 
 
 PropertyValue = Annotated[
-    Union[
-        CheckboxValue,
-        CreatedByValue,
-        CreatedTimeValue,
-        DateValue,
-        EmailValue,
-        FilesValue,
-        FormulaValue,
-        LastEditedByValue,
-        LastEditedTimeValue,
-        MultiSelectValue,
-        NumberValue,
-        PeopleValue,
-        PhoneNumberValue,
-        RelationValue,
-        RichTextValue,
-        RollupValue,
-        SelectValue,
-        StatusValue,
-        TitleValue,
-        URLValue,
-        UniqueIDValue,
-        VerificationValue,
-    ],
+    CheckboxValue
+    | CreatedByValue
+    | CreatedTimeValue
+    | DateValue
+    | EmailValue
+    | FilesValue
+    | FormulaValue
+    | LastEditedByValue
+    | LastEditedTimeValue
+    | MultiSelectValue
+    | NumberValue
+    | PeopleValue
+    | PhoneNumberValue
+    | RelationValue
+    | RichTextValue
+    | RollupValue
+    | SelectValue
+    | StatusValue
+    | TitleValue
+    | URLValue
+    | UniqueIDValue
+    | VerificationValue,
     Field(discriminator="type"),
 ]
 
@@ -1327,6 +1450,10 @@ PropertyValue = Annotated[
 
 
 class Page(BaseModel):
+    # Parsed DTOs are never mutated after validation; freezing makes
+    # that explicit. (pydantic has no slots support, so memory stays.)
+    model_config = ConfigDict(frozen=True)
+
     object: Literal["page"] = Field(repr=False)
     id: UUID4
     created_time: datetime = Field(repr=False)
@@ -1341,15 +1468,24 @@ class Page(BaseModel):
     url: HttpUrl
     public_url: HttpUrl | None = Field(repr=False)
 
+    _checkboxes: dict[str, CheckboxValue] | None = PrivateAttr(default=None)
+    _name: str | None = PrivateAttr(default=None)
+
     def __hash__(self):
         return hash(self.id)
 
     @staticmethod
     def parse(obj) -> Page:
-        return TypeAdapter(Page).validate_python(obj)
+        if isinstance(obj, bytes | str):
+            return _page_adapter().validate_json(obj)
+        return _page_adapter().validate_python(obj)
 
     def name(self) -> str:
-        return self.title().plain_text()
+        # Walking the title fragments is O(fragments) and callers read
+        # names repeatedly; the page is frozen, so cache the string.
+        if self._name is None:
+            self._name = self.title().plain_text()
+        return self._name
 
     def checkbox(self, property_name: str) -> CheckboxValue:
         property = self.properties[property_name]
@@ -1357,11 +1493,15 @@ class Page(BaseModel):
         return property
 
     def checkboxes(self) -> dict[str, CheckboxValue]:
-        props = {}
-        for name, prop in self.properties.items():
-            if isinstance(prop, CheckboxValue):
-                props[name] = prop
-        return props
+        # The only accessor that scans all properties; build it once per
+        # page, as the habit views call it repeatedly.
+        if self._checkboxes is None:
+            self._checkboxes = {
+                name: prop
+                for name, prop in self.properties.items()
+                if type(prop) is CheckboxValue
+            }
+        return self._checkboxes
 
     def created_by_prop(self, property_name: str = "Created by") -> CreatedByValue:
         property = self.properties[property_name]
@@ -1483,190 +1623,160 @@ class Page(BaseModel):
 # ==============================================================================
 
 
-class CheckboxDatabaseProperty(BaseModel):
-    type: Literal["checkbox"] = Field(repr=False)
+# Database schema properties are parsed only when the schema() helper is
+# called, so their validators are built on first use; id and name are
+# shared here so each class declares only its tag and payload.
+
+
+class BaseDatabaseProperty(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     id: str = Field(repr=False)
     name: str
+
+
+class CheckboxDatabaseProperty(BaseDatabaseProperty):
+    type: Literal["checkbox"] = Field(repr=False)
     checkbox: EmptyObject
 
 
-class CreatedByDatabaseProperty(BaseModel):
+class CreatedByDatabaseProperty(BaseDatabaseProperty):
     type: Literal["created_by"] = Field(repr=False)
-    id: str = Field(repr=False)
-    name: str
     created_by: EmptyObject
 
 
-class CreatedTimeDatabaseProperty(BaseModel):
+class CreatedTimeDatabaseProperty(BaseDatabaseProperty):
     type: Literal["created_time"] = Field(repr=False)
-    id: str = Field(repr=False)
-    name: str
     created_time: EmptyObject
 
 
-class DateDatabaseProperty(BaseModel):
+class DateDatabaseProperty(BaseDatabaseProperty):
     type: Literal["date"] = Field(repr=False)
-    id: str = Field(repr=False)
-    name: str
     date: EmptyObject
 
 
-class EmailDatabaseProperty(BaseModel):
+class EmailDatabaseProperty(BaseDatabaseProperty):
     type: Literal["email"] = Field(repr=False)
-    id: str = Field(repr=False)
-    name: str
     email: EmptyObject
 
 
-class FilesDatabaseProperty(BaseModel):
+class FilesDatabaseProperty(BaseDatabaseProperty):
     type: Literal["files"] = Field(repr=False)
-    id: str = Field(repr=False)
-    name: str
     files: EmptyObject
 
 
-class FormulaDatabaseProperty(BaseModel):
+class FormulaDatabaseProperty(BaseDatabaseProperty):
     type: Literal["formula"] = Field(repr=False)
-    id: str = Field(repr=False)
-    name: str
     formula: FormulaDatabaseObject
 
     def expression(self) -> str:
         return self.formula.expression
 
 
-class LastEditedByDatabaseProperty(BaseModel):
+class LastEditedByDatabaseProperty(BaseDatabaseProperty):
     type: Literal["last_edited_by"] = Field(repr=False)
-    id: str = Field(repr=False)
-    name: str
     last_edited_by: EmptyObject
 
 
-class LastEditedTimeDatabaseProperty(BaseModel):
+class LastEditedTimeDatabaseProperty(BaseDatabaseProperty):
     type: Literal["last_edited_time"] = Field(repr=False)
-    id: str = Field(repr=False)
-    name: str
     last_edited_time: EmptyObject
 
 
-class MultiSelectDatabaseProperty(BaseModel):
+class MultiSelectDatabaseProperty(BaseDatabaseProperty):
     type: Literal["multi_select"] = Field(repr=False)
-    id: str = Field(repr=False)
-    name: str
     multi_select: SelectDatabaseObject
 
     def options(self) -> list[SelectObject]:
         return self.multi_select.options
 
 
-class NumberDatabaseProperty(BaseModel):
+class NumberDatabaseProperty(BaseDatabaseProperty):
     type: Literal["number"] = Field(repr=False)
-    id: str = Field(repr=False)
-    name: str
     number: NumberDatabaseObject
 
     def format(self) -> str:
         return self.number.format
 
 
-class PeopleDatabaseProperty(BaseModel):
+class PeopleDatabaseProperty(BaseDatabaseProperty):
     type: Literal["people"] = Field(repr=False)
-    id: str = Field(repr=False)
-    name: str
     people: EmptyObject
 
 
-class PhoneNumberDatabaseProperty(BaseModel):
+class PhoneNumberDatabaseProperty(BaseDatabaseProperty):
     type: Literal["phone_number"] = Field(repr=False)
-    id: str = Field(repr=False)
-    name: str
     phone_number: EmptyObject
 
 
-class RelationDatabaseProperty(BaseModel):
+class RelationDatabaseProperty(BaseDatabaseProperty):
     type: Literal["relation"] = Field(repr=False)
-    id: str = Field(repr=False)
-    name: str
     relation: RelationDatabaseObject
 
     def database_id(self) -> str:
         return self.relation.database_id
 
 
-class RichTextDatabaseProperty(BaseModel):
+class RichTextDatabaseProperty(BaseDatabaseProperty):
     type: Literal["rich_text"] = Field(repr=False)
-    id: str = Field(repr=False)
-    name: str
     rich_text: EmptyObject
 
 
-class RollupDatabaseProperty(BaseModel):
+class RollupDatabaseProperty(BaseDatabaseProperty):
     type: Literal["rollup"] = Field(repr=False)
-    id: str = Field(repr=False)
-    name: str
     rollup: RollupDatabaseObject
 
     def value(self) -> RollupDatabaseObject:
         return self.rollup
 
 
-class SelectDatabaseProperty(BaseModel):
+class SelectDatabaseProperty(BaseDatabaseProperty):
     type: Literal["select"] = Field(repr=False)
-    id: str = Field(repr=False)
-    name: str
     select: SelectDatabaseObject
 
     def options(self) -> list[SelectObject]:
         return self.select.options
 
 
-class StatusDatabaseProperty(BaseModel):
+class StatusDatabaseProperty(BaseDatabaseProperty):
     type: Literal["status"] = Field(repr=False)
-    id: str = Field(repr=False)
-    name: str
     status: SelectDatabaseObject
 
     def options(self) -> list[SelectObject]:
         return self.status.options
 
 
-class TitleDatabaseProperty(BaseModel):
+class TitleDatabaseProperty(BaseDatabaseProperty):
     type: Literal["title"] = Field(repr=False)
-    id: str = Field(repr=False)
-    name: str
     title: EmptyObject
 
 
-class URLDatabaseProperty(BaseModel):
+class URLDatabaseProperty(BaseDatabaseProperty):
     type: Literal["url"] = Field(repr=False)
-    id: str = Field(repr=False)
-    name: str
     url: EmptyObject
 
 
 DatabaseProperty = Annotated[
-    Union[
-        CheckboxDatabaseProperty,
-        CreatedByDatabaseProperty,
-        CreatedTimeDatabaseProperty,
-        DateDatabaseProperty,
-        EmailDatabaseProperty,
-        FilesDatabaseProperty,
-        FormulaDatabaseProperty,
-        LastEditedByDatabaseProperty,
-        LastEditedTimeDatabaseProperty,
-        MultiSelectDatabaseProperty,
-        NumberDatabaseProperty,
-        PeopleDatabaseProperty,
-        PhoneNumberDatabaseProperty,
-        RelationDatabaseProperty,
-        RichTextDatabaseProperty,
-        RollupDatabaseProperty,
-        SelectDatabaseProperty,
-        StatusDatabaseProperty,
-        TitleDatabaseProperty,
-        URLDatabaseProperty,
-    ],
+    CheckboxDatabaseProperty
+    | CreatedByDatabaseProperty
+    | CreatedTimeDatabaseProperty
+    | DateDatabaseProperty
+    | EmailDatabaseProperty
+    | FilesDatabaseProperty
+    | FormulaDatabaseProperty
+    | LastEditedByDatabaseProperty
+    | LastEditedTimeDatabaseProperty
+    | MultiSelectDatabaseProperty
+    | NumberDatabaseProperty
+    | PeopleDatabaseProperty
+    | PhoneNumberDatabaseProperty
+    | RelationDatabaseProperty
+    | RichTextDatabaseProperty
+    | RollupDatabaseProperty
+    | SelectDatabaseProperty
+    | StatusDatabaseProperty
+    | TitleDatabaseProperty
+    | URLDatabaseProperty,
     Field(discriminator="type"),
 ]
 
@@ -1677,6 +1787,10 @@ DatabaseProperty = Annotated[
 
 
 class Database(BaseModel):
+    # Parsed DTOs are never mutated after validation; freezing makes
+    # that explicit. (pydantic has no slots support, so memory stays.)
+    model_config = ConfigDict(frozen=True)
+
     object: Literal["database"] = Field(repr=False)
     id: UUID4
     created_time: datetime
@@ -1696,7 +1810,9 @@ class Database(BaseModel):
 
     @staticmethod
     def parse(obj) -> Database:
-        return TypeAdapter(Database).validate_python(obj)
+        if isinstance(obj, bytes | str):
+            return _database_adapter().validate_json(obj)
+        return _database_adapter().validate_python(obj)
 
     def checkbox(self, property_name: str) -> CheckboxDatabaseProperty:
         property = self.properties[property_name]
@@ -1816,6 +1932,10 @@ T = TypeVar("T")
 
 
 class QueryResult(BaseModel, Generic[Result]):
+    # Parsed DTOs are never mutated after validation; freezing makes
+    # that explicit. (pydantic has no slots support, so memory stays.)
+    model_config = ConfigDict(frozen=True)
+
     object: Literal["list"] = Field(repr=False)
     type: str = Field(repr=False)
     results: list[Result]
@@ -1823,15 +1943,22 @@ class QueryResult(BaseModel, Generic[Result]):
     has_more: bool = Field(repr=False)
     request_id: str = Field(repr=False)
 
+    # The endpoint helpers funnel most results through by_name(), and some
+    # commands index the same result twice; build each mapping only once.
+    _by_id: dict[UUID, Result] | None = PrivateAttr(default=None)
+    _by_name: dict[str, Result] | None = PrivateAttr(default=None)
+
     @staticmethod
     def parse(obj) -> QueryResult:
-        return TypeAdapter(QueryResult).validate_python(obj)
+        if isinstance(obj, bytes | str):
+            return _query_result_adapter().validate_json(obj)
+        return _query_result_adapter().validate_python(obj)
 
     def count(self) -> int:
         return len(self.results)
 
     def __len__(self) -> int:
-        return self.count()
+        return len(self.results)
 
     def __getitem__(self, idx: int) -> Result:
         return self.results[idx]
@@ -1843,24 +1970,64 @@ class QueryResult(BaseModel, Generic[Result]):
         return {f(result): result for result in self.results}
 
     def by_id(self) -> dict[UUID, Result]:
-        return self.inverse_map(lambda x: x.id)
+        # Inlined comprehensions rather than inverse_map with a lambda;
+        # one Python frame per result adds up on large queries.
+        if self._by_id is None:
+            self._by_id = {result.id: result for result in self.results}
+        return self._by_id
 
     def by_name(self) -> dict[str, Result]:
-        return self.inverse_map(lambda x: x.title().plain_text())  # type: ignore
+        if self._by_name is None:
+            self._by_name = {
+                result.title().plain_text(): result  # type: ignore
+                for result in self.results
+            }
+        return self._by_name
 
     def first(self) -> Result:
         assert len(self.results) >= 1
         return self.results[0]
 
 
+# ==============================================================================
+# ADAPTERS
+# ==============================================================================
+
+# TypeAdapter construction compiles a pydantic-core schema; each parse
+# entry point used to pay that per call. Build each adapter once.
+
+
+@cache
+def _page_adapter() -> TypeAdapter:
+    return TypeAdapter(Page)
+
+
+@cache
+def _database_adapter() -> TypeAdapter:
+    return TypeAdapter(Database)
+
+
+@cache
+def _query_result_adapter() -> TypeAdapter:
+    return TypeAdapter(QueryResult)
+
+
 # ==============================================================================
 # HELPERS
 # ==============================================================================
 
 
+# Constant defaults are shared across builder calls instead of being
+# rebuilt; nothing downstream mutates them.
+_EMPTY_RICH_TEXT = RichText(root=[])
+_DEFAULT_ICON = Emoji(emoji="❤️")
+
+
 def _richify(text: str | RichText | None) -> RichText:
     if isinstance(text, RichText):
         return text
+    if text is None:
+        return _EMPTY_RICH_TEXT
     return RichText(
         root=[
             SimpleTextFragmentObject(
@@ -1868,13 +2035,18 @@ def _richify(text: str | RichText | None) -> RichText:
                 text=TextObject(content=text, link=None),
             )
         ]
-        if text is not None
-        else []
     )
 
 
+@lru_cache(maxsize=1024)
+def _http_url(url: str) -> HttpUrl:
+    # Builders re-emit the same URLs constantly (default icons above
+    # all); cache the parsed form so repeats skip the URL validator.
+    return HttpUrl(url=url)
+
+
 def _url(url: str) -> ExternalLinkObject:
-    return ExternalLinkObject(url=HttpUrl(url=url))
+    return ExternalLinkObject(url=_http_url(url))
 
 
 def _children(blocks: list[InnerBlock] | None) -> InnerBlockList:
@@ -1882,7 +2054,7 @@ def _children(blocks: list[InnerBlock] | None) -> InnerBlockList:
 
 
 def _default_icon() -> Icon:
-    return BlockBuilder.emoji("❤️")
+    return _DEFAULT_ICON
 
 
 # ==============================================================================
@@ -1895,10 +2067,13 @@ _Text = str | RichText
 class BlockBuilder:
     @staticmethod
     def rich(*args: str) -> RichText:
+        # Bound to locals so the per-fragment loop skips the global
+        # lookups; noticeable when building thousands of fragments.
+        fragment = SimpleTextFragmentObject
+        text = TextObject
         return RichText(
             root=[
-                SimpleTextFragmentObject(text=TextObject(content=arg, link=None))
-                for arg in args
+                fragment(text=text(content=arg, link=None)) for arg in args
             ]
         )
 
@@ -1907,7 +2082,7 @@ class BlockBuilder:
         """
         Create a bookmark block.
         """
-        return Bookmark(url=HttpUrl(url=url), caption=_richify(caption))
+        return Bookmark(url=_http_url(url), caption=_richify(caption))
 
     @staticmethod
     def breadcrumb() -> Breadcrumb:
@@ -1984,7 +2159,7 @@ class BlockBuilder:
         """
         Create an embedded block.
         """
-        return Embed(url=HttpUrl(url=url))
+        return Embed(url=_http_url(url))
 
     @staticmethod
     def equation(expression: str) -> Equation:
@@ -2001,7 +2176,7 @@ class BlockBuilder:
         return File(
             file=ExternalNamedFile(
                 name=name,
-                external=ExternalLinkObject(url=HttpUrl(url=url)),
+                external=ExternalLinkObject(url=_http_url(url)),
                 caption=_richify(caption),
             )
         )
@@ -2135,7 +2310,8 @@ class BlockBuilder:
         """
         Create a table row.
         """
-        return TableRow(cells=[_richify(text) for text in cells])
+        richify = _richify
+        return TableRow(cells=[richify(text) for text in cells])
 
     @staticmethod
     def toc() -> Toc:
@@ -2189,7 +2365,7 @@ class BlockBuilder:
         """
         Create an external file object.
         """
-        return ExternalUnnamedFile(external=ExternalLinkObject(url=HttpUrl(url=url)))
+        return ExternalUnnamedFile(external=ExternalLinkObject(url=_http_url(url)))
 
     @staticmethod
     def emoji(emoji: str) -> Emoji:
@@ -17,8 +17,11 @@
 # CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE
 # OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
-from collections.abc import Iterable, Mapping
-from typing import TypeVar
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import Future
+from itertools import chain, islice
+from threading import Thread
+from typing import TypeVar, cast
 
 from iterfzf import iterfzf as _iterfzf
 
@@ -28,22 +31,74 @@ from iterfzf import iterfzf as _iterfzf
 
 T = TypeVar("T")
 
+# Distinguishes "key absent" from a legitimately None value in dictfzf.
+_MISSING = object()
+
+
+def prefetch(fn: Callable[[], T]) -> Future[T]:
+    """Run FN on a daemon thread, returning a Future for its result.
+
+    Overlaps a network fetch with user think-time. Unlike an executor
+    worker, a daemon thread cannot hold the process open at exit, so a
+    command that aborts before consuming the result still exits at once.
+    """
+    future: Future[T] = Future()
+
+    def run() -> None:
+        try:
+            future.set_result(fn())
+        except BaseException as error:
+            future.set_exception(error)
+
+    Thread(target=run, daemon=True).start()
+    return future
+
 
 def dictfzf(mapping: Mapping[str, T], **kwargs) -> T | None:
+    # Launching fzf costs a fork+exec and terminal setup; skip the
+    # subprocess entirely when the outcome is already determined.
+    if len(mapping) == 0:
+        return None
+    if len(mapping) == 1:
+        return next(iter(mapping.values()))
+
+    # NUL framing on both pipes: keys with embedded newlines survive the
+    # round-trip and neither side scans for line breaks.
+    kwargs.setdefault("read0", True)
     choice = _iterfzf(mapping.keys(), **kwargs)
     if choice is None:
         return None
-    assert isinstance(choice, str) and choice in mapping
-    return mapping[choice]
 
+    # Single probe instead of a membership assert followed by indexing;
+    # fzf echoes a key verbatim, so a miss means real corruption.
+    value = mapping.get(choice, _MISSING)
+    if value is _MISSING:
+        raise KeyError(choice)
+    return value  # type: ignore[return-value]
+
+
+def iterfzf(iterable: Iterable[str], **kwargs) -> str | None:
+    # Peek at the head instead of materializing the whole input, so
+    # generator inputs stream into fzf and matching starts before the
+    # full candidate set exists.
+    iterator = iter(iterable)
+    head = list(islice(iterator, 2))
+    if len(head) == 1:
+        return head[0]
+
+    # Cancelling the picker yields None; the return shape is fixed by
+    # the multi flag, so a cast beats re-checking it at runtime.
+    kwargs.setdefault("read0", True)
+    return cast("str | None", _iterfzf(chain(head, iterator), **kwargs))
 
-def iterfzf(iterable: Iterable[str], **kwargs) -> str:
-    choice = _iterfzf(iterable, **kwargs)
-    assert isinstance(choice, str)
-    return choice
 
+def multifzf(iterable: Iterable[str], **kwargs) -> list[str] | None:
+    iterator = iter(iterable)
+    head = list(islice(iterator, 1))
+    if not head:
+        return []
 
-def multifzf(iterable: Iterable[str], **kwargs) -> list[str]:
-    choices = _iterfzf(iterable, multi=True, **kwargs)
-    assert isinstance(choices, list) and all(isinstance(item, str) for item in choices)
-    return choices
+    kwargs.setdefault("read0", True)
+    return cast(
+        "list[str] | None", _iterfzf(chain(head, iterator), multi=True, **kwargs)
+    )